@@ -10,6 +10,7 @@ This module provides:
 """
 
 import re
+from functools import lru_cache
 from typing import List, Set, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -59,6 +60,7 @@ class ConversationIDManager:
     }
     
     @classmethod
+    @lru_cache(maxsize=4096)
     def generate_standard_id(cls, project_slug: str, user_id: str = DEFAULT_USER_ID) -> str:
         """
         Generate conversation ID in standard format.
@@ -69,6 +71,9 @@ class ConversationIDManager:
             
         Returns:
             Standard format conversation ID: "project-slug:user-id"
+        
+        Results are memoized per (project_slug, user_id) since the same pairs
+        recur on every conversation read and write.
         """
         # Validate inputs
         project_slug = validate_project_name(project_slug, normalize=True)
@@ -221,10 +226,11 @@ class LegacyConversationResolver:
         stored under different ID formats due to system evolution.
         """
         project_conversations = []
+        target_slug = project_slug.lower()
         
         for conv_id in existing_conversation_ids:
             analysis = ConversationIDManager.analyze_id(conv_id)
-            if analysis.project_slug.lower() == project_slug.lower():
+            if analysis.project_slug.lower() == target_slug:
                 project_conversations.append(conv_id)
                 
         return project_conversations
@@ -17,10 +17,11 @@ from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-import aiosqlite
 import logging
 
 from .feature_flags import is_feature_enabled
+from .memory_unified import PooledConnection
+from .validation import VALID_MESSAGE_ROLES
 from .migration_logging import get_migration_logger, MigrationEventType, MigrationSeverity
 
 logger = logging.getLogger(__name__)
@@ -174,7 +175,7 @@ class DataValidator:
                     timestamp=start_time.isoformat()
                 )
             
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 # Check required tables exist
                 required_tables = ['conversations', 'projects', 'memory_entries', 'sessions']
                 existing_tables = []
@@ -243,7 +244,7 @@ class DataValidator:
         start_time = datetime.now()
         
         try:
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 # Get all conversations
                 async with db.execute("""
                     SELECT conversation_id, role, content, timestamp, user_id, created_at
@@ -280,7 +281,7 @@ class DataValidator:
                         stats.date_range = (stats.date_range[0], created_at)
                     
                     # Check for issues
-                    if not role or role not in ['user', 'assistant', 'system']:
+                    if not role or role not in VALID_MESSAGE_ROLES:
                         issues.append(f"Invalid role '{role}' in conversation {conversation_id}")
                         stats.has_invalid_roles = True
                     
@@ -357,7 +358,7 @@ class DataValidator:
         start_time = datetime.now()
         
         try:
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 # Get all unique conversation IDs
                 async with db.execute("SELECT DISTINCT conversation_id FROM conversations") as cursor:
                     rows = await cursor.fetchall()
@@ -464,7 +465,7 @@ class DataValidator:
         start_time = datetime.now()
         
         try:
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 completeness_checks = {}
                 
                 # Check conversation data completeness
@@ -545,7 +546,7 @@ class DataValidator:
         start_time = datetime.now()
         
         try:
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 duplicate_analysis = {}
                 
                 # Find exact duplicate messages (same content, role, conversation)
@@ -665,14 +666,14 @@ class DataValidator:
             
             # Check database connectivity
             try:
-                async with aiosqlite.connect(str(self.db_path)) as db:
+                async with PooledConnection(str(self.db_path), read_only=True) as db:
                     await db.execute("SELECT 1")
                     readiness_checks['db_connectivity'] = True
             except Exception:
                 readiness_checks['db_connectivity'] = False
             
             # Check data volume (ensure not too large for safe migration)
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 async with db.execute("SELECT COUNT(*) FROM conversations") as cursor:
                     message_count = (await cursor.fetchone())[0]
                     readiness_checks['message_count'] = message_count
@@ -723,7 +724,7 @@ class DataValidator:
             performance_metrics = {}
             
             # Time basic database operations
-            async with aiosqlite.connect(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                 # Time conversation read operation
                 read_start = datetime.now()
                 async with db.execute("SELECT * FROM conversations LIMIT 100") as cursor:
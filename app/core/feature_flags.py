@@ -368,6 +368,17 @@ class FeatureFlagManager:
             name: self.is_enabled(name, user_id)
             for name in self._flags.keys()
         }
+    
+    async def snapshot(self, user_id: str = "anonymous") -> Dict[str, bool]:
+        """
+        Resolve every flag for a user in one pass.
+        
+        Taken under the manager lock so the result is consistent with concurrent
+        phase or flag changes; callers checking several flags can then do plain
+        dict lookups instead of awaiting is_feature_enabled() per flag.
+        """
+        async with self._lock:
+            return self.list_active_flags(user_id)
 
 
 # === Global Instance Management ===
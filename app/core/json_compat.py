@@ -0,0 +1,26 @@
+"""
+JSON encoding and decoding that uses orjson when it's installed.
+
+orjson is optional; without it these fall back to the standard json module.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize obj to a JSON string; default converts values JSON can't represent."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=default)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or UTF-8 bytes; raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
@@ -32,34 +32,45 @@ class SecureLogger:
     """Wrapper for secure logging operations"""
     
     def __init__(self, name: str):
+        # Each method returns early for disabled levels, so dropped records skip sanitization
         self.logger = logging.getLogger(name)
     
     def info(self, message: Any, *args, **kwargs):
         """Safe info logging"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         sanitized_msg = SecurityUtils.sanitize_for_logging(message)
         sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
         self.logger.info(sanitized_msg, *sanitized_args, **kwargs)
     
     def warning(self, message: Any, *args, **kwargs):
         """Safe warning logging"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         sanitized_msg = SecurityUtils.sanitize_for_logging(message)
         sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
         self.logger.warning(sanitized_msg, *sanitized_args, **kwargs)
     
     def error(self, message: Any, *args, **kwargs):
         """Safe error logging"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         sanitized_msg = SecurityUtils.sanitize_for_logging(message)
         sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
         self.logger.error(sanitized_msg, *sanitized_args, **kwargs)
     
     def debug(self, message: Any, *args, **kwargs):
         """Safe debug logging"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         sanitized_msg = SecurityUtils.sanitize_for_logging(message)
         sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
         self.logger.debug(sanitized_msg, *sanitized_args, **kwargs)
     
     def critical(self, message: Any, *args, **kwargs):
         """Safe critical logging"""
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
         sanitized_msg = SecurityUtils.sanitize_for_logging(message)
         sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
         self.logger.critical(sanitized_msg, *sanitized_args, **kwargs)
@@ -102,6 +113,8 @@ def get_secure_logger(name: str) -> SecureLogger:
 # Convenience functions for safe logging
 def safe_log_info(logger: logging.Logger, message: str, *args):
     """Safe info logging that removes sensitive data"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     sanitized_message = SecurityUtils.sanitize_for_logging(message)
     sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
     logger.info(sanitized_message, *sanitized_args)
@@ -109,6 +122,8 @@ def safe_log_info(logger: logging.Logger, message: str, *args):
 
 def safe_log_warning(logger: logging.Logger, message: str, *args):
     """Safe warning logging that removes sensitive data"""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     sanitized_message = SecurityUtils.sanitize_for_logging(message)
     sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
     logger.warning(sanitized_message, *sanitized_args)
@@ -116,6 +131,8 @@ def safe_log_warning(logger: logging.Logger, message: str, *args):
 
 def safe_log_error(logger: logging.Logger, message: str, *args):
     """Safe error logging that removes sensitive data"""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     sanitized_message = SecurityUtils.sanitize_for_logging(message)
     sanitized_args = [SecurityUtils.sanitize_for_logging(arg) for arg in args]
     logger.error(sanitized_message, *sanitized_args)
\ No newline at end of file
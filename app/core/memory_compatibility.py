@@ -86,16 +86,24 @@ class CompatibilityConversationMemory:
             memory = await self._get_unified_memory()
             conversation_id = self.project_slug
             
+            # Persist both sides of the exchange in a single transaction
+            rows = []
+            if user_input:
+                rows.append({'role': 'user', 'content': user_input})
+            if ai_response:
+                rows.append({'role': 'assistant', 'content': ai_response})
+            
+            if not await memory.add_messages_bulk(conversation_id, rows, user_id):
+                raise RuntimeError(f"Database write failed for {conversation_id}")
+            
             messages_added = []
             
             if user_input:
-                await memory.add_message(conversation_id, "user", user_input, user_id)
                 user_msg = HumanMessage(content=user_input)
                 self.messages.append(user_msg)
                 messages_added.append(user_msg)
             
             if ai_response:
-                await memory.add_message(conversation_id, "assistant", ai_response, user_id)
                 ai_msg = AIMessage(content=ai_response)
                 self.messages.append(ai_msg)
                 self.last_ai_response = ai_response
@@ -11,18 +11,19 @@ Uses SQLite for structured data + file system for human-readable documents.
 """
 
 import asyncio
+import os
 import sqlite3
 import json
 import re
+from itertools import groupby
+from collections import OrderedDict
 import aiosqlite
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 from abc import ABC, abstractmethod
 import logging
 
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-
 logger = logging.getLogger(__name__)
 
 # Import centralized validation functions
@@ -34,12 +35,14 @@ from .validation import (
     validate_conversation_id,
     validate_section_name,
     validate_contributor_name,
-    validate_file_path_security
+    validate_file_path_security,
+    VALID_MESSAGE_ROLES
 )
 
 def _connection_is_closed(connection: aiosqlite.Connection) -> bool:
     """Check if aiosqlite connection is closed using private attribute."""
-    return getattr(connection, '_closed', True)
+    # aiosqlite drops its underlying sqlite3 connection on close()
+    return getattr(connection, '_connection', None) is None
 
 # Use the same async-safe utilities from langgraph_runner
 import concurrent.futures
@@ -77,12 +80,21 @@ async def shutdown_file_executor():
             _file_executor = None
 
 
+# Number of query_only connections available to concurrent readers (WAL allows
+# many readers alongside the single writer)
+READ_POOL_SIZE = max(2, min(os.cpu_count() or 1, 4))
+
+# Number of project documents kept in memory by each manager (least recently used evicted first)
+PROJECT_CACHE_SIZE = 128
+
+
 class DatabaseConnectionPool:
     """Simple connection pool for SQLite to prevent resource exhaustion"""
     
-    def __init__(self, db_path: str, max_connections: int = 10):
+    def __init__(self, db_path: str, max_connections: int = 10, read_only: bool = False):
         self.db_path = db_path
         self.max_connections = max_connections
+        self.read_only = read_only
         self._connections = asyncio.Queue(maxsize=max_connections)
         self._created_connections = 0
         self._lock = asyncio.Lock()
@@ -109,31 +121,36 @@ class DatabaseConnectionPool:
                 async with self._lock:
                     if self._created_connections < self.max_connections:
                         try:
-                            connection = await aiosqlite.connect(self.db_path)
+                            # "file:" paths are SQLite URIs, e.g. file:name?mode=memory&cache=shared
+                            connection = await aiosqlite.connect(self.db_path, uri=self.db_path.startswith("file:"))
                             # Enable WAL mode for better concurrency
                             await connection.execute("PRAGMA journal_mode=WAL")
                             await connection.execute("PRAGMA synchronous=NORMAL")
                             await connection.execute("PRAGMA temp_store=memory")
                             await connection.execute("PRAGMA mmap_size=268435456")  # 256MB
+                            if self.read_only:
+                                await connection.execute("PRAGMA query_only=1")
                             self._created_connections += 1
                             return connection
                         except Exception as e:
                             logger.error(f"Failed to create database connection to {self.db_path}: {e}")
                             raise
-                    else:
-                        # Wait for a connection to become available
-                        try:
-                            connection = await asyncio.wait_for(self._connections.get(), timeout=30.0)
-                            # Verify the waited connection is still valid
-                            if connection.is_closed():
-                                async with self._lock:
-                                    self._created_connections -= 1
-                                # Continue loop to try again instead of recursion
-                                retry_count += 1
-                                continue
-                            return connection
-                        except asyncio.TimeoutError:
-                            raise RuntimeError(f"Timeout waiting for database connection to {self.db_path}")
+                
+                # Pool is at capacity: wait for a connection to be returned. This happens
+                # outside the lock so other tasks can still return or replace connections.
+                try:
+                    connection = await asyncio.wait_for(self._connections.get(), timeout=30.0)
+                except asyncio.TimeoutError:
+                    raise RuntimeError(f"Timeout waiting for database connection to {self.db_path}")
+                
+                # Verify the waited connection is still valid
+                if _connection_is_closed(connection):
+                    async with self._lock:
+                        self._created_connections -= 1
+                    # Continue loop to try again instead of recursion
+                    retry_count += 1
+                    continue
+                return connection
         
         # If we've exhausted all retries
         raise RuntimeError(f"Failed to get valid connection after {max_retries} attempts")
@@ -174,7 +191,7 @@ class DatabaseConnectionPool:
             try:
                 connection = self._connections.get_nowait()
                 try:
-                    if not connection.is_closed():
+                    if not _connection_is_closed(connection):
                         await connection.close()
                 except Exception as e:
                     logger.warning(f"Error closing pooled connection: {e}")
@@ -184,20 +201,30 @@ class DatabaseConnectionPool:
             self._created_connections = 0
 
 
-def get_connection_pool(db_path: str) -> DatabaseConnectionPool:
-    """Get or create a connection pool for a database"""
+def get_connection_pool(db_path: str, read_only: bool = False) -> DatabaseConnectionPool:
+    """
+    Get or create a connection pool for a database.
+    
+    Each database gets a single-connection writer pool (SQLite only allows one
+    writer at a time) and a separate pool of query_only reader connections, so
+    reads never queue behind a slow write.
+    """
     global _connection_pools
-    if db_path not in _connection_pools:
-        _connection_pools[db_path] = DatabaseConnectionPool(db_path)
-    return _connection_pools[db_path]
+    key = (db_path, read_only)
+    if key not in _connection_pools:
+        if read_only:
+            _connection_pools[key] = DatabaseConnectionPool(db_path, max_connections=READ_POOL_SIZE, read_only=True)
+        else:
+            _connection_pools[key] = DatabaseConnectionPool(db_path, max_connections=1)
+    return _connection_pools[key]
 
 
 class PooledConnection:
     """Context manager for pooled database connections"""
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_only: bool = False):
         self.db_path = db_path
-        self.pool = get_connection_pool(db_path)
+        self.pool = get_connection_pool(db_path, read_only)
         self.connection = None
     
     async def __aenter__(self) -> aiosqlite.Connection:
@@ -216,19 +243,32 @@ class PooledConnection:
                 logger.error(f"Error returning connection to pool: {e}")
                 # Attempt to close the connection directly if pool return fails
                 try:
-                    if not self.connection.is_closed():
+                    if not _connection_is_closed(self.connection):
                         await self.connection.close()
                 except Exception:
                     pass
             finally:
                 self.connection = None
 
+def read_text_unbuffered(file_path: Path) -> str:
+    """Read a whole UTF-8 text file with one unbuffered read.
+
+    Skips the BufferedReader/TextIOWrapper setup of Path.read_text, which is pure
+    overhead when the file is consumed in one go, and applies the same universal
+    newline translation so callers see identical text.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        content = f.readall().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
 async def safe_file_read(file_path: Path) -> Optional[str]:
     """Thread-safe async file reading that doesn't block the event loop."""
     def _read_file():
         try:
             if file_path.exists():
-                return file_path.read_text(encoding='utf-8')
+                return read_text_unbuffered(file_path)
             return None
         except PermissionError as e:
             logger.error(f"Permission denied reading file {file_path}: {e}")
@@ -263,6 +303,42 @@ async def safe_file_write(file_path: Path, content: str) -> bool:
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(get_file_executor(), _write_file)
 
+async def safe_file_append(file_path: Path, content: str) -> bool:
+    """Thread-safe async append to the end of a file without rewriting it."""
+    def _append_file():
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, 'a', encoding='utf-8') as f:
+                f.write(content)
+            return True
+        except PermissionError as e:
+            logger.error(f"Permission denied appending to file {file_path}: {e}")
+            return False
+        except OSError as e:
+            logger.error(f"OS error appending to file {file_path}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error appending to file {file_path}: {e}", exc_info=True)
+            return False
+    
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(get_file_executor(), _append_file)
+
+async def safe_file_version(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Return a cheap (mtime_ns, size) version stamp for a file, or None if it is missing."""
+    def _stat_file():
+        try:
+            stat = file_path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(f"OS error reading file status {file_path}: {e}")
+            return None
+    
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(get_file_executor(), _stat_file)
+
 async def safe_json_read(file_path: Path) -> Optional[Dict[str, Any]]:
     """Thread-safe async JSON file reading."""
     def _read_json():
@@ -366,6 +442,8 @@ class UnifiedMemoryManager(MemoryInterface):
         self.memory_dir = Path(memory_dir)
         self._file_lock = asyncio.Lock()
         self._initialized = False
+        # Parsed project documents keyed by name, tagged with the file version they were read at
+        self._project_cache: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
     
     async def initialize(self) -> bool:
         """Initialize the unified memory system"""
@@ -382,7 +460,7 @@ class UnifiedMemoryManager(MemoryInterface):
             async with PooledConnection(str(self.db_path)) as db:
                 await self._create_tables(db)
             
-            # Pre-warm connection pool for better performance
+            # Pre-warm reader pool for better performance
             await self._prewarm_connection_pool()
             
             self._initialized = True
@@ -456,6 +534,8 @@ class UnifiedMemoryManager(MemoryInterface):
         
         # Create indexes for performance
         await db.execute("CREATE INDEX IF NOT EXISTS idx_conversations_id ON conversations(conversation_id)")
+        # Covers per-conversation history reads (ORDER BY created_at) and latest-message aggregation
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_conversations_id_created ON conversations(conversation_id, created_at)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_conversations_timestamp ON conversations(timestamp)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_projects_updated ON projects(updated_at)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_sessions_project ON sessions(project_name, user_id)")
@@ -463,12 +543,12 @@ class UnifiedMemoryManager(MemoryInterface):
         await db.commit()
     
     async def _prewarm_connection_pool(self):
-        """Pre-warm the connection pool for better performance"""
+        """Pre-warm the reader pool for better performance (the writer was opened by initialize)"""
         try:
-            pool = get_connection_pool(str(self.db_path))
-            # Create 2 initial connections to speed up first requests
+            pool = get_connection_pool(str(self.db_path), read_only=True)
+            # Create up to 2 initial connections to speed up first requests
             connections = []
-            for _ in range(2):
+            for _ in range(min(2, pool.max_connections)):
                 conn = await pool.get_connection()
                 connections.append(conn)
             
@@ -504,20 +584,31 @@ class UnifiedMemoryManager(MemoryInterface):
             return False
     
     async def get_conversation(self, conversation_id: str, limit: int = None) -> List[Dict[str, Any]]:
-        """Get conversation history from database"""
+        """Get conversation history from database, oldest first. With a limit, returns the most recent `limit` messages."""
         try:
-            async with PooledConnection(str(self.db_path)) as db:
-                    query = """
-                        SELECT role, content, timestamp, user_id, metadata 
-                        FROM conversations 
-                        WHERE conversation_id = ? 
-                        ORDER BY created_at ASC
-                    """
-                    params = [conversation_id]
-                    
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                     if limit:
-                        query += " LIMIT ?"
-                        params.append(limit)
+                        # Walk the (conversation_id, created_at) index backwards for the
+                        # latest rows, then put the window back in chronological order
+                        query = """
+                            SELECT role, content, timestamp, user_id, metadata FROM (
+                                SELECT id, role, content, timestamp, user_id, metadata, created_at
+                                FROM conversations 
+                                WHERE conversation_id = ? 
+                                ORDER BY created_at DESC, id DESC
+                                LIMIT ?
+                            )
+                            ORDER BY created_at ASC, id ASC
+                        """
+                        params = [conversation_id, limit]
+                    else:
+                        query = """
+                            SELECT role, content, timestamp, user_id, metadata 
+                            FROM conversations 
+                            WHERE conversation_id = ? 
+                            ORDER BY created_at ASC, id ASC
+                        """
+                        params = [conversation_id]
                     
                     async with db.execute(query, params) as cursor:
                         rows = await cursor.fetchall()
@@ -536,11 +627,92 @@ class UnifiedMemoryManager(MemoryInterface):
             logger.error(f"Error getting conversation: {e}")
             return []
     
+    async def get_conversations_bulk(self, requests: List[Tuple[str, Optional[int]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get several conversations in one query.
+        
+        Args:
+            requests: (conversation_id, limit) pairs; a limit of None returns every message
+            
+        Returns:
+            Dictionary mapping each requested conversation ID to its messages, in the
+            same order and with the same limit semantics as get_conversation()
+        """
+        if not requests:
+            return {}
+        
+        try:
+            # Number rows per conversation newest-first and keep the latest `limit`
+            # of each, matching get_conversation's windowing
+            values = ",".join("(?, ?)" for _ in requests)
+            query = f"""
+                WITH wanted(conversation_id, max_rows) AS (VALUES {values}),
+                numbered AS (
+                    SELECT c.conversation_id, c.role, c.content, c.timestamp, c.user_id, c.metadata,
+                           w.max_rows,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY c.conversation_id ORDER BY c.created_at DESC, c.id DESC
+                           ) AS rn
+                    FROM conversations c
+                    JOIN wanted w ON w.conversation_id = c.conversation_id
+                )
+                SELECT conversation_id, role, content, timestamp, user_id, metadata
+                FROM numbered
+                WHERE max_rows IS NULL OR rn <= max_rows
+                ORDER BY conversation_id, rn DESC
+            """
+            params = []
+            for conversation_id, limit in requests:
+                params.extend((conversation_id, limit or None))
+            
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
+                async with db.execute(query, params) as cursor:
+                    rows = await cursor.fetchall()
+            
+            conversations = {conversation_id: [] for conversation_id, _ in requests}
+            for conversation_id, group in groupby(rows, key=lambda row: row[0]):
+                conversations[conversation_id] = [
+                    {
+                        'role': row[1],
+                        'content': row[2],
+                        'timestamp': row[3],
+                        'user_id': row[4],
+                        'metadata': json.loads(row[5]) if row[5] else {}
+                    }
+                    for row in group
+                ]
+            return conversations
+        except Exception as e:
+            logger.error(f"Error getting conversations in bulk: {e}")
+            return {conversation_id: [] for conversation_id, _ in requests}
+    
+    async def count_conversation_messages(self, conversation_id: str, limit: int = None) -> int:
+        """Count messages in a conversation (capped at limit) without loading their content"""
+        try:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
+                if limit:
+                    query = """
+                        SELECT COUNT(*) FROM (
+                            SELECT 1 FROM conversations WHERE conversation_id = ? LIMIT ?
+                        )
+                    """
+                    params = (conversation_id, limit)
+                else:
+                    query = "SELECT COUNT(*) FROM conversations WHERE conversation_id = ?"
+                    params = (conversation_id,)
+                
+                async with db.execute(query, params) as cursor:
+                    row = await cursor.fetchone()
+                return row[0] if row else 0
+        except Exception as e:
+            logger.error(f"Error counting conversation messages: {e}")
+            return 0
+    
     async def add_message(self, conversation_id: str, role: str, content: str, user_id: str = "anonymous", metadata: Dict = None) -> bool:
         """Add message to conversation (compatibility method)"""
         # Validate inputs
         validate_conversation_id(conversation_id, allow_simple=True)
-        if role not in ['user', 'assistant', 'system']:
+        if role not in VALID_MESSAGE_ROLES:
             raise ValueError("Role must be 'user', 'assistant', or 'system'")
         validate_content_size(content)
         sanitized_user_id = validate_user_id(user_id, strict=False)
@@ -558,6 +730,48 @@ class UnifiedMemoryManager(MemoryInterface):
         }
         return await self.save_conversation(conversation_id, message)
     
+    async def add_messages_bulk(self, conversation_id: str, messages: List[Dict[str, Any]], user_id: str = "anonymous") -> bool:
+        """Add multiple messages to a conversation in a single transaction"""
+        # Validate inputs (same rules as add_message)
+        validate_conversation_id(conversation_id, allow_simple=True)
+        sanitized_user_id = validate_user_id(user_id, strict=False)
+        
+        rows = []
+        for message in messages:
+            role = message.get('role')
+            if role not in VALID_MESSAGE_ROLES:
+                raise ValueError("Role must be 'user', 'assistant', or 'system'")
+            content = message.get('content', '')
+            validate_content_size(content)
+            metadata = message.get('metadata')
+            if metadata:
+                validate_json_data(metadata)
+            
+            rows.append((
+                conversation_id,
+                role,
+                content,
+                message.get('timestamp', datetime.now().isoformat()),
+                sanitized_user_id,
+                json.dumps(metadata or {})
+            ))
+        
+        if not rows:
+            return True
+        
+        try:
+            async with PooledConnection(str(self.db_path)) as db:
+                # One executemany + one commit amortizes the per-row commit cost
+                await db.executemany("""
+                    INSERT INTO conversations (conversation_id, role, content, timestamp, user_id, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving conversation batch: {e}")
+            return False
+    
     async def get_recent_history(self, conversation_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent conversation history (compatibility method)"""
         # Validate inputs
@@ -578,35 +792,73 @@ class UnifiedMemoryManager(MemoryInterface):
         sanitized_user_id = validate_user_id(user_id, strict=False)
         
         async with self._file_lock:
-            try:
-                # Save to file system (authoritative for content) - now secure
-                project_file = self.memory_dir / f"{sanitized_name}.md"
-                
-                # Enhanced path traversal protection
-                if not validate_file_path_security(project_file, self.memory_dir):
-                    logger.error(f"Path traversal attempt detected: {project_file}")
-                    return False
-                
-                success = await safe_file_write(project_file, content)
-                
-                if success:
-                    # Update database metadata
-                    async with PooledConnection(str(self.db_path)) as db:
-                        await db.execute("""
-                            INSERT OR REPLACE INTO projects (name, file_path, updated_at, user_id)
-                            VALUES (?, ?, ?, ?)
-                        """, (
-                            sanitized_name,
-                            str(project_file),
-                            datetime.now().isoformat(),
-                            sanitized_user_id
-                        ))
-                        await db.commit()
-                
-                return success
-            except Exception as e:
-                logger.error(f"Error saving project {project_name}: {e}")
+            return await self._write_project(sanitized_name, content, sanitized_user_id)
+    
+    async def _write_project(self, sanitized_name: str, content: str, sanitized_user_id: str) -> bool:
+        """Rewrite a project file in full; the caller holds _file_lock"""
+        try:
+            # Save to file system (authoritative for content) - now secure
+            project_file = self.memory_dir / f"{sanitized_name}.md"
+            
+            # Enhanced path traversal protection
+            if not validate_file_path_security(project_file, self.memory_dir):
+                logger.error(f"Path traversal attempt detected: {project_file}")
+                return False
+            
+            success = await safe_file_write(project_file, content)
+            
+            if success:
+                await self._record_project_write(sanitized_name, project_file, sanitized_user_id, content)
+            
+            return success
+        except Exception as e:
+            logger.error(f"Error saving project {sanitized_name}: {e}")
+            return False
+    
+    async def _append_project(self, sanitized_name: str, content: str, sanitized_user_id: str,
+                              full_content: Optional[str] = None) -> bool:
+        """Append content to the end of an existing project file; the caller holds _file_lock"""
+        try:
+            project_file = self.memory_dir / f"{sanitized_name}.md"
+            
+            if not validate_file_path_security(project_file, self.memory_dir):
+                logger.error(f"Path traversal attempt detected: {project_file}")
                 return False
+            
+            success = await safe_file_append(project_file, content)
+            
+            if success:
+                await self._record_project_write(sanitized_name, project_file, sanitized_user_id, full_content)
+            
+            return success
+        except Exception as e:
+            logger.error(f"Error appending to project {sanitized_name}: {e}")
+            return False
+    
+    async def _record_project_write(self, sanitized_name: str, project_file: Path, sanitized_user_id: str,
+                                    content: Optional[str] = None):
+        """Update project metadata after its file has been written"""
+        # Cache the document just written so the next read skips the file; text with
+        # carriage returns would read back translated, so leave that to a real read.
+        # A size that differs from the text means another writer got in, so don't cache.
+        self._project_cache.pop(sanitized_name, None)
+        if content is not None and '\r' not in content:
+            version = await safe_file_version(project_file)
+            if version is not None and version[1] == len(content.encode('utf-8')):
+                self._project_cache[sanitized_name] = (version, content)
+                while len(self._project_cache) > PROJECT_CACHE_SIZE:
+                    self._project_cache.popitem(last=False)
+        async with PooledConnection(str(self.db_path)) as db:
+            await db.execute("""
+                INSERT OR REPLACE INTO projects (name, file_path, updated_at, user_id)
+                VALUES (?, ?, ?, ?)
+            """, (
+                sanitized_name,
+                str(project_file),
+                datetime.now().isoformat(),
+                sanitized_user_id
+            ))
+            await db.commit()
     
     async def get_project(self, project_name: str) -> Optional[str]:
         """Get project content from file system"""
@@ -620,7 +872,24 @@ class UnifiedMemoryManager(MemoryInterface):
                 logger.error(f"Path traversal attempt detected: {project_file}")
                 return None
             
-            return await safe_file_read(project_file)
+            # Serve unchanged documents from memory; the stat is far cheaper than re-reading the file
+            version = await safe_file_version(project_file)
+            if version is None:
+                self._project_cache.pop(sanitized_name, None)
+                return None
+            
+            cached = self._project_cache.get(sanitized_name)
+            if cached is not None and cached[0] == version:
+                self._project_cache.move_to_end(sanitized_name)
+                return cached[1]
+            
+            content = await safe_file_read(project_file)
+            if content is not None:
+                self._project_cache[sanitized_name] = (version, content)
+                self._project_cache.move_to_end(sanitized_name)
+                while len(self._project_cache) > PROJECT_CACHE_SIZE:
+                    self._project_cache.popitem(last=False)
+            return content
         except ValueError as e:
             logger.warning(f"Invalid project name '{project_name}': {e}")
             return None
@@ -652,17 +921,32 @@ class UnifiedMemoryManager(MemoryInterface):
             sanitized_user_id = validate_user_id(user_id, strict=False)
             sanitized_contributor = validate_contributor_name(contributor)
             
-            current_content = await self.get_project(sanitized_name)
-            if current_content is None:
-                logger.error(f"Project {project_name} not found")
-                return False
-            
-            # Use the same section update logic from MarkdownMemory
-            updated_content = await self._update_markdown_section(
-                current_content, sanitized_section, content, sanitized_contributor, sanitized_user_id
-            )
-            
-            return await self.save_project(sanitized_name, updated_content, sanitized_user_id)
+            # Hold the lock from read to write so concurrent updates can't drop each other's sections
+            async with self._file_lock:
+                project_file = self.memory_dir / f"{sanitized_name}.md"
+                read_version = await safe_file_version(project_file)
+                current_content = await self.get_project(sanitized_name)
+                if current_content is None:
+                    logger.error(f"Project {project_name} not found")
+                    return False
+                
+                # Use the same section update logic from MarkdownMemory
+                updated_content = await self._update_markdown_section(
+                    current_content, sanitized_section, content, sanitized_contributor, sanitized_user_id
+                )
+                validate_content_size(updated_content)
+                
+                # New sections and additions to the last section only extend the document,
+                # so write just the added text rather than the whole file. Another process
+                # may have changed the file since it was read, so append only onto that version.
+                if (updated_content.startswith(current_content)
+                        and await safe_file_version(project_file) == read_version):
+                    return await self._append_project(
+                        sanitized_name, updated_content[len(current_content):], sanitized_user_id,
+                        full_content=updated_content
+                    )
+                
+                return await self._write_project(sanitized_name, updated_content, sanitized_user_id)
         except Exception as e:
             logger.error(f"Error updating project section: {e}")
             return False
@@ -670,8 +954,6 @@ class UnifiedMemoryManager(MemoryInterface):
     async def _update_markdown_section(self, content: str, section: str, new_content: str, 
                                      contributor: str, user_id: str) -> str:
         """Update a specific section in markdown content (simplified from MarkdownMemory)"""
-        import re
-        
         # Add timestamp for tracking
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
@@ -716,7 +998,7 @@ class UnifiedMemoryManager(MemoryInterface):
     async def load_memory(self, key: str) -> Optional[str]:
         """Load general memory entry"""
         try:
-            async with PooledConnection(str(self.db_path)) as db:
+            async with PooledConnection(str(self.db_path), read_only=True) as db:
                     async with db.execute("SELECT content FROM memory_entries WHERE key = ?", (key,)) as cursor:
                         row = await cursor.fetchone()
                     return row[0] if row else None
@@ -846,28 +1128,36 @@ async def get_unified_memory() -> UnifiedMemoryManager:
     """Get singleton instance of unified memory manager"""
     global _unified_memory
     
+    # Fast path: once initialized, callers get the instance without touching the lock
+    instance = _unified_memory
+    if instance is not None:
+        return instance
+    
     async with _memory_lock:
         if _unified_memory is None:
-            _unified_memory = UnifiedMemoryManager()
-            await _unified_memory.initialize()
+            instance = UnifiedMemoryManager()
+            await instance.initialize()
+            # Publish only after initialize() so the fast path never sees a half-built instance
+            _unified_memory = instance
         return _unified_memory
 
 async def reset_unified_memory():
     """Reset the global instance and cleanup resources (useful for testing and shutdown)"""
     global _unified_memory
     async with _memory_lock:
+        # Pools are shared by every manager, including ones built directly in tests
+        for key in list(_connection_pools.keys()):
+            pool = _connection_pools.pop(key)
+            pool_kind = "reader" if pool.read_only else "writer"
+            try:
+                await pool.close_all()
+                logger.info(f"Closed {pool_kind} connection pool for {pool.db_path}")
+            except Exception as e:
+                logger.warning(f"Error closing {pool_kind} connection pool for {pool.db_path}: {e}")
+        
         if _unified_memory is not None:
             logger.info("Cleaning up unified memory resources")
             
-            # Close all connection pools
-            for db_path in list(_connection_pools.keys()):
-                pool = _connection_pools.pop(db_path)
-                try:
-                    await pool.close_all()
-                    logger.info(f"Closed connection pool for {db_path}")
-                except Exception as e:
-                    logger.warning(f"Error closing connection pool for {db_path}: {e}")
-            
             # Shutdown thread pool executor
             await shutdown_file_executor()
             
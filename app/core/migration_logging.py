@@ -10,8 +10,11 @@ This module provides:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,9 +22,39 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import traceback
 
+from . import json_compat
+
 # Configure migration-specific logger
 logger = logging.getLogger(__name__)
 
+# How long buffered events wait before being written out in one batch
+FLUSH_INTERVAL_SECONDS = 0.05
+
+# Cap on buffered events; beyond this new events are dropped rather than
+# letting observability back up into conversation handling
+MAX_PENDING_EVENTS = 10_000
+
+# Cached ISO timestamp and the millisecond it was formatted for
+_last_ts_ms = -1
+_last_iso = ""
+
+def fast_iso_utc() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+    
+    Events logged within the same millisecond share one formatted timestamp,
+    so tight logging loops skip the timezone lookup and string formatting.
+    """
+    global _last_ts_ms, _last_iso
+    
+    now_ns = time.time_ns()
+    # Compare buckets for equality so a wall clock stepped backwards still refreshes
+    now_ms = now_ns // 1_000_000
+    if now_ms != _last_ts_ms:
+        _last_iso = datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat()
+        _last_ts_ms = now_ms
+    return _last_iso
+
 class MigrationEventType(Enum):
     """Types of migration events to track."""
     # Data operations
@@ -121,6 +154,17 @@ class MigrationLogger:
         # Performance tracking
         self._operation_start_times: Dict[str, datetime] = {}
         
+        # Write-behind buffer: serialized events waiting for the background flusher
+        self._pending: List[str] = []
+        self._pending_event = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
+        # Held from taking a batch until it is on disk, so batches append in order
+        # and flush() waits for a write the flusher already has in progress
+        self._write_lock = asyncio.Lock()
+        # Event loop the locks, event and flusher task above belong to
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped_events = 0
+        
         # Data integrity checksums using SHA256 for verification
         
         self._ensure_log_directory()
@@ -132,8 +176,21 @@ class MigrationLogger:
         except Exception as e:
             logger.error(f"Failed to create log directory {self.log_dir}: {e}")
     
+    def _bind_to_running_loop(self):
+        """Recreate the loop-bound primitives and flusher when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A finished loop's flusher never runs again; events it left queued
+            # stay in _pending for the new flusher
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._pending_event = asyncio.Event()
+            self._write_lock = asyncio.Lock()
+            self._flusher_task = None
+    
     async def log_event(self, event: MigrationEvent):
         """Log a migration event to structured log file."""
+        self._bind_to_running_loop()
         async with self._lock:
             try:
                 # Add session ID if not present
@@ -146,9 +203,16 @@ class MigrationLogger:
                 event_dict['event_type'] = event.event_type.value
                 event_dict['severity'] = event.severity.value
                 
-                # Write to JSONL file
-                with open(self.log_file, 'a') as f:
-                    f.write(json.dumps(event_dict, default=str) + '\n')
+                # Queue for the background flusher instead of writing per event
+                if len(self._pending) >= MAX_PENDING_EVENTS:
+                    self.dropped_events += 1
+                    if self.dropped_events == 1 or self.dropped_events % 1000 == 0:
+                        logger.warning(f"Migration log buffer full, dropped {self.dropped_events} events so far")
+                    return
+                self._pending.append(json_compat.dumps(event_dict, default=str) + '\n')
+                self._pending_event.set()
+                if self._flusher_task is None or self._flusher_task.done():
+                    self._flusher_task = asyncio.create_task(self._flusher())
                 
                 # Also log to standard logger based on severity
                 log_level = {
@@ -164,6 +228,59 @@ class MigrationLogger:
             except Exception as e:
                 logger.error(f"Failed to log migration event: {e}")
     
+    async def _flusher(self):
+        """Write queued events to the JSONL file in batches, one fsync per batch."""
+        try:
+            while True:
+                await self._pending_event.wait()
+                await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+                self._pending_event.clear()
+                async with self._write_lock:
+                    batch, self._pending = self._pending, []
+                    if batch:
+                        await asyncio.to_thread(self._write_batch, batch)
+        finally:
+            # Don't lose events still queued when the task is cancelled at shutdown
+            self._write_pending()
+    
+    def _write_batch(self, batch: List[str]):
+        """Append a batch of serialized events to the log file and fsync once."""
+        try:
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.writelines(batch)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} migration events: {e}")
+    
+    def _write_pending(self):
+        """Synchronously write any events still waiting in the buffer."""
+        batch, self._pending = self._pending, []
+        if batch:
+            self._write_batch(batch)
+    
+    async def flush(self):
+        """Write all buffered events to disk now, after any batch already being written."""
+        self._bind_to_running_loop()
+        async with self._write_lock:
+            batch, self._pending = self._pending, []
+            if batch:
+                await asyncio.to_thread(self._write_batch, batch)
+    
+    async def close(self):
+        """Stop the background flusher and write out any buffered events."""
+        self._bind_to_running_loop()
+        # Holding the write lock means the flusher is not mid-write when it is cancelled
+        async with self._write_lock:
+            if self._flusher_task is not None and not self._flusher_task.done():
+                self._flusher_task.cancel()
+                try:
+                    await self._flusher_task
+                except asyncio.CancelledError:
+                    pass
+            self._flusher_task = None
+            self._write_pending()
+    
     async def start_operation(self, operation_name: str, 
                             project_slug: Optional[str] = None,
                             user_id: Optional[str] = None,
@@ -176,7 +293,7 @@ class MigrationLogger:
             event_type=MigrationEventType.DATA_MIGRATION_STARTED,
             severity=MigrationSeverity.INFO,
             message=f"Started operation: {operation_name}",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_iso_utc(),
             project_slug=project_slug,
             user_id=user_id,
             conversation_id=conversation_id,
@@ -208,7 +325,7 @@ class MigrationLogger:
             event_type=event_type,
             severity=severity,
             message=event_message,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_iso_utc(),
             duration_ms=duration_ms,
             record_count=record_count,
             session_id=self._session_id,
@@ -255,7 +372,7 @@ class MigrationLogger:
             event_type=event_type,
             severity=severity,
             message=f"Conversation {operation_type}: {conversation_id}",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_iso_utc(),
             project_slug=project_slug,
             user_id=user_id,
             conversation_id=conversation_id,
@@ -291,7 +408,7 @@ class MigrationLogger:
             event_type=MigrationEventType.INTEGRITY_CHECK_COMPLETED,
             severity=severity,
             message=message,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_iso_utc(),
             conversation_id=conversation_id,
             record_count=actual_count,
             data_after=details,
@@ -317,7 +434,7 @@ class MigrationLogger:
             event_type=MigrationEventType.PERFORMANCE_BENCHMARK,
             severity=MigrationSeverity.INFO,
             message=message,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_iso_utc(),
             duration_ms=duration_ms,
             record_count=record_count,
             memory_usage_mb=memory_usage_mb,
@@ -333,7 +450,7 @@ class MigrationLogger:
             event_type=MigrationEventType.PHASE_CHANGE,
             severity=MigrationSeverity.INFO,
             message=f"Migration phase changed from {from_phase} to {to_phase}",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_iso_utc(),
             migration_phase=to_phase,
             feature_flags=feature_flags,
             session_id=self._session_id
@@ -342,7 +459,6 @@ class MigrationLogger:
     def _calculate_checksum(self, data: Dict[str, Any]) -> str:
         """Calculate a SHA256 checksum for data integrity tracking."""
         try:
-            import hashlib
             # Sort keys to ensure consistent checksum
             sorted_json = json.dumps(data, sort_keys=True)
             return hashlib.sha256(sorted_json.encode()).hexdigest()
@@ -355,10 +471,13 @@ class MigrationLogger:
         try:
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
+            # Make sure buffered events are on disk before reading them back
+            await self.flush()
+            
             # Read recent events from log file
             events = []
             if self.log_file.exists():
-                with open(self.log_file, 'r') as f:
+                with open(self.log_file, 'r', encoding='utf-8') as f:
                     for line in f:
                         try:
                             event_data = json.loads(line.strip())
@@ -445,11 +564,25 @@ async def get_migration_logger() -> MigrationLogger:
     """Get singleton instance of migration logger."""
     global _migration_logger
     
+    # Fast path: logging calls sit on every conversation turn, so skip the lock once created
+    instance = _migration_logger
+    if instance is not None:
+        return instance
+    
     async with _logger_lock:
         if _migration_logger is None:
             _migration_logger = MigrationLogger()
         return _migration_logger
 
+async def shutdown_migration_logger():
+    """Flush buffered events and stop the migration logger's background flusher."""
+    global _migration_logger
+    
+    async with _logger_lock:
+        if _migration_logger is not None:
+            await _migration_logger.close()
+            _migration_logger = None
+
 # === Convenience Functions ===
 
 async def log_migration_event(event_type: MigrationEventType, 
@@ -462,7 +595,7 @@ async def log_migration_event(event_type: MigrationEventType,
         event_type=event_type,
         severity=severity,
         message=message,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=fast_iso_utc(),
         **kwargs
     )
     await logger_instance.log_event(event)
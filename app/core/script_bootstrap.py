@@ -0,0 +1,90 @@
+"""
+Shared start-up helpers for the command-line scripts in scripts/ and the test suite.
+
+bootstrap_script() configures logging and the event loop the same way for every
+script. Concurrently running checks can print into per-task buffers so their
+output is written out in one block per check instead of interleaving.
+"""
+
+import asyncio
+import logging
+import sys
+from contextvars import ContextVar
+from typing import Any, Awaitable, List, Optional, TextIO, Tuple, TypeVar
+
+# uvloop is optional; it speeds up the event loop when installed (uvicorn[standard] ships it)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+# Writes deferred by the current task: (target stream, text) in the order they were made
+_task_output: ContextVar[Optional[List[Tuple[TextIO, str]]]] = ContextVar("_task_output", default=None)
+
+class TaskLocalStream:
+    """Stream proxy that defers writes made inside run_buffered() until that task completes."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        pending = _task_output.get()
+        if pending is None:
+            return self._stream.write(text)
+        pending.append((self._stream, text))
+        return len(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+def install_task_local_output() -> None:
+    """
+    Route stdout and stderr through TaskLocalStream.
+
+    Call this before logging is configured so log handlers write through the proxy
+    and a check's tracebacks stay next to the output it printed.
+    """
+    if not isinstance(sys.stdout, TaskLocalStream):
+        sys.stdout = TaskLocalStream(sys.stdout)
+    if not isinstance(sys.stderr, TaskLocalStream):
+        sys.stderr = TaskLocalStream(sys.stderr)
+
+async def run_buffered(coro: Awaitable[T]) -> T:
+    """Await a coroutine, replaying its stdout/stderr writes in order once it completes."""
+    pending: List[Tuple[TextIO, str]] = []
+    token = _task_output.set(pending)
+    try:
+        return await coro
+    finally:
+        _task_output.reset(token)
+        for stream, text in pending:
+            stream.write(text)
+        for stream in {stream for stream, _ in pending}:
+            stream.flush()
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when it's installed."""
+    return uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+
+def install_fast_event_loop() -> None:
+    """Make asyncio.run() use uvloop when it's installed."""
+    if uvloop is not None:
+        uvloop.install()
+
+def configure_script_logging() -> None:
+    """Log one compact line per failure (plus its traceback) on stderr."""
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+def bootstrap_script(task_local_output: bool = False) -> None:
+    """
+    Prepare a script's process before asyncio.run(main()).
+
+    With task_local_output, stdout and stderr are wrapped before logging binds
+    stderr, so run_buffered() also captures each check's log output.
+    """
+    if task_local_output:
+        install_task_local_output()
+    configure_script_logging()
+    install_fast_event_loop()
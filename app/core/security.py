@@ -2,6 +2,7 @@
 Security utilities for safe logging and data handling
 """
 
+import os
 import re
 from typing import Any, Dict, List, Union
 
@@ -67,7 +68,6 @@ class SecurityUtils:
     @staticmethod
     def validate_environment_vars() -> List[str]:
         """Validate that sensitive environment variables are not logged"""
-        import os
         warnings = []
         
         sensitive_env_vars = [
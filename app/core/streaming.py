@@ -0,0 +1,23 @@
+"""
+Server-Sent Events helpers shared by the chat runners and the API routes.
+"""
+
+import asyncio
+import re
+from typing import Any, AsyncGenerator, Dict
+
+from . import json_compat
+
+# A word plus its trailing whitespace (or a leading whitespace run) per streamed frame
+STREAM_CHUNK_PATTERN = re.compile(r'\S+\s*|\s+')
+
+def sse_event(payload: Dict[str, Any]) -> str:
+    """Format a payload as a single Server-Sent Events frame."""
+    return f"data: {json_compat.dumps(payload)}\n\n"
+
+async def stream_text_events(text: str, delay: float = 0.0) -> AsyncGenerator[str, None]:
+    """Stream text to the client as a sequence of word-sized token events."""
+    for match in STREAM_CHUNK_PATTERN.finditer(text):
+        yield sse_event({'token': match.group()})
+        if delay:
+            await asyncio.sleep(delay)
@@ -22,10 +22,15 @@ MAX_CONVERSATION_ID_LENGTH = 200
 # Validation patterns
 VALID_PROJECT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
 VALID_USER_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_@.-]+$')
+INVALID_USER_ID_CHARS = re.compile(r'[^a-zA-Z0-9_@.-]')
+INVALID_SECTION_NAME_CHARS = re.compile(r'[<>:"/\\|?*]')
 
 # Default values
 DEFAULT_USER_ID = "anonymous"
 
+# Roles a stored conversation message may have
+VALID_MESSAGE_ROLES = frozenset({'user', 'assistant', 'system'})
+
 
 def validate_project_name(project_name: str, normalize: bool = True) -> str:
     """
@@ -108,7 +113,7 @@ def validate_user_id(user_id: Optional[str], strict: bool = False) -> str:
             raise ValueError("User ID can only contain letters, numbers, underscores, @, dot, and hyphen")
     else:
         # Permissive mode: remove invalid characters
-        sanitized = re.sub(r'[^a-zA-Z0-9_@.-]', '', sanitized)
+        sanitized = INVALID_USER_ID_CHARS.sub('', sanitized)
         if not sanitized:
             return DEFAULT_USER_ID
     
@@ -228,7 +233,7 @@ def validate_section_name(section: str) -> str:
         raise ValueError("Section name too long (max 200 chars)")
     
     # Basic sanitization - remove problematic characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', sanitized)
+    sanitized = INVALID_SECTION_NAME_CHARS.sub('', sanitized)
     
     if not sanitized:
         raise ValueError("Section name cannot be empty after sanitization")
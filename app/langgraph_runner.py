@@ -7,8 +7,14 @@ import asyncio
 import aiofiles
 import json
 import os
+import random
 import re
 import concurrent.futures
+import copy
+import hashlib
+import httpx
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, AsyncGenerator, Optional, List, Tuple
 from pathlib import Path
@@ -24,8 +30,10 @@ from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
 
 # Phase 2: Import unified memory system directly
-from app.core.memory_unified import get_unified_memory, UnifiedMemoryManager
+from app.core.memory_unified import get_unified_memory, UnifiedMemoryManager, safe_file_version, read_text_unbuffered
 from app.core.feature_flags import is_feature_enabled
+from app.core import json_compat
+from app.core.streaming import sse_event, stream_text_events
 from app.core.migration_logging import get_migration_logger, log_conversation_read, log_conversation_write
 from app.core.conversation_id_manager import ConversationIDManager
 
@@ -41,12 +49,61 @@ logger = get_secure_logger(__name__)
 MEMORY_DIR = Path("app/memory")
 INDEX_FILE = MEMORY_DIR / "index.json"
 
+# Number of most recent messages loaded as conversation context for a turn
+HISTORY_WINDOW = 20
+
+# Reference analyses kept per analyzer, least recently used evicted first
+REFERENCE_ANALYSIS_CACHE_SIZE = 256
+
+# Document extractions kept per InfoAgent, least recently used evicted first
+EXTRACTION_CACHE_SIZE = 64
+
+def _compile_phrases(phrases: List[str]) -> re.Pattern:
+    """Compile substring phrases into one case-insensitive alternation scanned in a single pass."""
+    return re.compile("|".join(map(re.escape, phrases)), re.IGNORECASE)
+
+# Keyword scanners used by the agents, compiled once at import time
+REFERENCE_KEYWORDS_PATTERN = _compile_phrases([
+    "add that", "add those", "include that", "include those",
+    "use that", "apply that", "implement that", "add this",
+    "those metrics", "that information", "the metrics", "the details",
+    "what you mentioned", "what you suggested", "your recommendation"
+])
+# Reference-analysis confidence levels trusted enough to act on
+ACTIONABLE_REFERENCE_CONFIDENCE = frozenset({"high", "medium"})
+
+UPDATE_KEYWORDS_PATTERN = _compile_phrases(["add", "update", "document", "section", "include", "insert"])
+CONTEXT_KEYWORDS_PATTERN = _compile_phrases(['project', 'document', 'section', 'update', 'what', 'how', 'when', 'where'])
+
+# Template placeholder lines in a section: *placeholder text*, - [ ] placeholder tasks, _placeholder text_
+PLACEHOLDER_LINE_PATTERN = re.compile(r'^(?:\*[^*]*\*|- \[ \].*|_[^_]*_)$')
+
+# Project document markers rewritten on every section update
+LAST_UPDATED_PATTERN = re.compile(r'_Last updated: .*?_')
+CHANGE_LOG_TABLE_HEADER_PATTERN = re.compile(r'(## Change Log.*?\n\|.*?\n\|.*?\n)', re.DOTALL)
+CHANGE_LOG_SECTION_PATTERN = re.compile(r'(## Change Log.*)', re.DOTALL)
+
+def _section_pattern(section: str) -> re.Pattern:
+    """Compile the pattern matching a '## section' heading and its body up to the next heading."""
+    return re.compile(rf'(## {re.escape(section)})(.*?)(?=## |\Z)', re.DOTALL)
+
 # Global unified memory instance
 _unified_memory = None
 
 # Global thread executor for file operations
 _file_executor = None
 
+# Timeouts for OpenAI calls: fail fast when the API is unreachable, but allow a
+# full completion to generate before the read gives up
+LLM_REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=5.0, pool=10.0)
+
+# Shared HTTP client for OpenAI calls so turns reuse warm keep-alive connections
+_http_async_client: Optional[httpx.AsyncClient] = None
+_http_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Reference analyzers shared per model so agents reuse one LLM client and analysis cache
+_reference_analyzers: Dict[str, "LLMReferenceAnalyzer"] = {}
+
 # Cleanup flag to prevent memory leaks
 _cleanup_registered = False
 
@@ -62,12 +119,53 @@ def get_file_executor() -> concurrent.futures.ThreadPoolExecutor:
         logger.info(f"Initialized file operations thread executor with {max_workers} workers")
     return _file_executor
 
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get or create the HTTP client shared by every ChatOpenAI instance."""
+    global _http_async_client, _http_async_client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    # Pooled connections belong to the loop that opened them, so start afresh on a new loop
+    stale_loop = loop is not None and _http_async_client_loop not in (None, loop)
+    if stale_loop:
+        _discard_http_client(_http_async_client, _http_async_client_loop)
+    if _http_async_client is None or _http_async_client.is_closed or stale_loop:
+        _http_async_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+        _http_async_client_loop = loop
+        logger.info("Initialized shared HTTP client for OpenAI requests")
+    return _http_async_client
+
+def _discard_http_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+    """Close a replaced shared client whose connections belong to another event loop."""
+    if client.is_closed:
+        return
+    if loop.is_running():
+        # The owning loop is alive in another thread; close there so its transports shut down cleanly
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        # aclose() can't run without the owning loop; the shutdown hooks close the client
+        # before their loop ends, so only the reference is dropped here
+        logger.info("Dropped shared HTTP client left behind by a finished event loop")
+
+async def close_shared_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_async_client, _http_async_client_loop
+    client = _http_async_client
+    _http_async_client = None
+    _http_async_client_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 async def safe_file_read(file_path: Path) -> Optional[str]:
     """Thread-safe async file reading that doesn't block the event loop."""
     def _read_file():
         try:
             if file_path.exists():
-                return file_path.read_text(encoding='utf-8')
+                return read_text_unbuffered(file_path)
             return None
         except FileNotFoundError:
             # File doesn't exist, return None as expected
@@ -110,9 +208,9 @@ async def safe_json_read(file_path: Path) -> Optional[Dict]:
     def _read_json():
         try:
             if file_path.exists():
-                content = file_path.read_text(encoding='utf-8')
+                content = file_path.read_bytes()
                 if content.strip():
-                    return json.loads(content)
+                    return json_compat.loads(content)
             return None
         except FileNotFoundError:
             # File doesn't exist, return None as expected
@@ -196,14 +294,18 @@ def cleanup_global_resources():
         
         # Clean up unified memory system
         from .core.memory_unified import reset_unified_memory
-        import asyncio
+        from .core.migration_logging import shutdown_migration_logger
         try:
             # Try to clean up async resources safely
             loop = asyncio.get_event_loop()
             if loop.is_running():
                 asyncio.create_task(reset_unified_memory())
+                asyncio.create_task(shutdown_migration_logger())
+                asyncio.create_task(close_shared_http_client())
             else:
                 loop.run_until_complete(reset_unified_memory())
+                loop.run_until_complete(shutdown_migration_logger())
+                loop.run_until_complete(close_shared_http_client())
         except RuntimeError:
             # No event loop running, skip async cleanup
             pass
@@ -226,7 +328,7 @@ async def get_conversation_memory_for_project(project_slug: str, user_id: str =
             memory = CompatibilityConversationMemory(project_slug)
             await memory._initialize_langchain_memory()
             return {
-                'messages': memory.get_langchain_messages(max_messages=20),
+                'messages': memory.get_langchain_messages(max_messages=HISTORY_WINDOW),
                 'last_ai_response': memory.last_ai_response,
                 'conversation_id': project_slug
             }
@@ -236,7 +338,7 @@ async def get_conversation_memory_for_project(project_slug: str, user_id: str =
             conversation_id = ConversationIDManager.generate_standard_id(project_slug, user_id)
             
             # Get conversation history
-            messages_data = await unified_memory.get_conversation(conversation_id, limit=20)
+            messages_data = await unified_memory.get_conversation(conversation_id, limit=HISTORY_WINDOW)
             
             # Convert to LangChain messages
             messages = []
@@ -279,14 +381,18 @@ async def add_conversation_to_memory(project_slug: str, user_input: str, ai_resp
             unified_memory = await get_unified_memory_instance()
             conversation_id = ConversationIDManager.generate_standard_id(project_slug, user_id)
             
-            # Add messages
+            # Add both sides of the exchange in a single transaction
+            messages = []
             if user_input:
-                await unified_memory.add_message(conversation_id, "user", user_input, user_id)
-                await log_conversation_write(conversation_id, {"role": "user", "content": user_input}, user_id)
-                
+                messages.append({"role": "user", "content": user_input})
             if ai_response:
-                await unified_memory.add_message(conversation_id, "assistant", ai_response, user_id)
-                await log_conversation_write(conversation_id, {"role": "assistant", "content": ai_response}, user_id)
+                messages.append({"role": "assistant", "content": ai_response})
+            
+            if not await unified_memory.add_messages_bulk(conversation_id, messages, user_id):
+                return False
+            
+            for message in messages:
+                await log_conversation_write(conversation_id, message, user_id)
             
             return True
             
@@ -381,13 +487,48 @@ class AgentState(MessagesState):
     should_update_document: bool
     document_updates_made: List[str]
 
+# Static instructions sent ahead of every analysis, so the prompt prefix is
+# byte-identical across calls and the provider's prompt cache can reuse it
+REFERENCE_ANALYSIS_INSTRUCTIONS = """You are analyzing a user message to determine if they're referencing something from the previous conversation.
+
+You will be given the recent CONVERSATION CONTEXT, the MOST RECENT AI RESPONSE and the CURRENT USER MESSAGE.
+
+Analyze if the user is referencing something from the conversation, particularly the most recent AI response.
+
+Look for:
+- Explicit references: "add that", "include those", "use what you suggested", "implement that"
+- Implicit references: "add it", "include them", "that's good", "perfect"
+- Pronoun references: "that", "those", "it", "them" referring to previous content
+- Contextual references: "the metrics", "your recommendation", "what you mentioned"
+
+CRITICAL: When extracting referenced_content, focus on the MOST RECENT AI RESPONSE.
+- If the AI provided numbered recommendations/steps, extract those specific items
+- If the user says "those" or "items 1-5", extract the numbered list from the AI's response
+- If the AI provided advice/suggestions, extract the specific advice given
+- Prioritize content from the AI's immediate previous response over older conversation context
+
+IMPORTANT: Only return TRUE if the user is clearly referring to something specific from the AI's recent response or the conversation. General responses like "yes", "ok", or new questions should return FALSE.
+
+Return ONLY valid JSON in this exact format:
+{
+    "has_reference": true or false,
+    "reference_type": "explicit" or "implicit" or "pronoun" or "contextual" or "none",
+    "referenced_content": "the specific content they're referring to from the AI's response, or empty string if no reference",
+    "action_requested": "what they want done with the referenced content, or empty string if no reference", 
+    "confidence": "high" or "medium" or "low"
+}
+
+Do not include any other text or explanation, only the JSON response."""
+
 class LLMReferenceAnalyzer:
     """LLM-powered reference detection system that understands conversational context."""
     
     def __init__(self, model: str = "gpt-4o-mini"):
         self.model = model
         self.llm = None  # Lazy initialization to avoid API key issues during import
-        self._analysis_cache = {}  # Simple cache for repeated analyses
+        self._http_client = None  # Shared HTTP client the LLM was built on
+        # Prompt digest -> analysis result, so identical analyses skip the LLM round-trip
+        self._analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._performance_metrics = {
             "total_requests": 0,
             "cache_hits": 0,
@@ -399,15 +540,20 @@ class LLMReferenceAnalyzer:
     
     def _initialize_llm(self):
         """Lazy initialization of LLM to handle API key timing."""
-        if self.llm is None:
+        # Rebuild when the shared HTTP client was replaced, e.g. on a new event loop
+        http_client = get_shared_http_client()
+        if self.llm is None or self._http_client is not http_client:
             try:
                 # Use the same key parsing logic as existing system
                 api_key = self._get_openai_api_key()
                 self.llm = ChatOpenAI(
                     model=self.model, 
                     temperature=0.1,
-                    api_key=api_key
+                    api_key=api_key,
+                    timeout=LLM_REQUEST_TIMEOUT,
+                    http_async_client=http_client
                 )
+                self._http_client = http_client
             except ValueError as e:
                 logger.error(f"Invalid model configuration for reference analysis: {e}")
                 raise
@@ -450,30 +596,36 @@ class LLMReferenceAnalyzer:
             - action_requested: str (what they want done)
             - confidence: str (high/medium/low)
         """
-        import time
         start_time = time.time()
         
         try:
             # Track total requests
             self._performance_metrics["total_requests"] += 1
             
-            # Initialize LLM if needed
-            self._initialize_llm()
-            
-            # Create cache key for repeated analyses
-            cache_key = hash(f"{user_message}_{last_ai_response[:100]}")
-            if cache_key in self._analysis_cache:
-                self._performance_metrics["cache_hits"] += 1
-                logger.debug("Using cached reference analysis")
-                return self._analysis_cache[cache_key]
-            
             # Build analysis prompt
             analysis_prompt = self._build_analysis_prompt(
                 user_message, conversation_context, last_ai_response
             )
             
+            # Key the cache on everything the LLM sees, so a hit never needs the LLM
+            cache_key = hashlib.blake2b(
+                f"{self.model}\x00{analysis_prompt}".encode(), digest_size=16
+            ).hexdigest()
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                self._performance_metrics["cache_hits"] += 1
+                logger.debug("Using cached reference analysis")
+                return cached
+            
+            # Initialize LLM if needed
+            self._initialize_llm()
+            
             # Get LLM analysis
-            messages = [SystemMessage(content=analysis_prompt)]
+            messages = [
+                SystemMessage(content=REFERENCE_ANALYSIS_INSTRUCTIONS),
+                HumanMessage(content=analysis_prompt)
+            ]
             response = await self.llm.ainvoke(messages)
             
             # Parse JSON response
@@ -488,6 +640,8 @@ class LLMReferenceAnalyzer:
                 
                 # Cache successful analysis
                 self._analysis_cache[cache_key] = result
+                if len(self._analysis_cache) > REFERENCE_ANALYSIS_CACHE_SIZE:
+                    self._analysis_cache.popitem(last=False)
                 
                 # Track performance metrics
                 response_time = time.time() - start_time
@@ -509,49 +663,20 @@ class LLMReferenceAnalyzer:
             return self._create_fallback_response()
     
     def _build_analysis_prompt(self, user_message: str, context: str, last_response: str) -> str:
-        """Build optimized prompt for reference detection."""
+        """Build the per-call part of the reference detection prompt (instructions are sent separately)."""
         
         # Limit context to essential information for cost optimization
         limited_context = context[-1500:] if len(context) > 1500 else context
         limited_response = last_response[-800:] if len(last_response) > 800 else last_response
         
-        return f"""You are analyzing a user message to determine if they're referencing something from the previous conversation.
-
-CONVERSATION CONTEXT (recent):
+        return f"""CONVERSATION CONTEXT (recent):
 {limited_context}
 
 MOST RECENT AI RESPONSE:
 {limited_response}
 
 CURRENT USER MESSAGE:
-{user_message}
-
-Analyze if the user is referencing something from the conversation, particularly the most recent AI response.
-
-Look for:
-- Explicit references: "add that", "include those", "use what you suggested", "implement that"
-- Implicit references: "add it", "include them", "that's good", "perfect"
-- Pronoun references: "that", "those", "it", "them" referring to previous content
-- Contextual references: "the metrics", "your recommendation", "what you mentioned"
-
-CRITICAL: When extracting referenced_content, focus on the MOST RECENT AI RESPONSE above.
-- If the AI provided numbered recommendations/steps, extract those specific items
-- If the user says "those" or "items 1-5", extract the numbered list from the AI's response
-- If the AI provided advice/suggestions, extract the specific advice given
-- Prioritize content from the AI's immediate previous response over older conversation context
-
-IMPORTANT: Only return TRUE if the user is clearly referring to something specific from the AI's recent response or the conversation. General responses like "yes", "ok", or new questions should return FALSE.
-
-Return ONLY valid JSON in this exact format:
-{{
-    "has_reference": true or false,
-    "reference_type": "explicit" or "implicit" or "pronoun" or "contextual" or "none",
-    "referenced_content": "the specific content they're referring to from the AI's response, or empty string if no reference",
-    "action_requested": "what they want done with the referenced content, or empty string if no reference", 
-    "confidence": "high" or "medium" or "low"
-}}
-
-Do not include any other text or explanation, only the JSON response."""
+{user_message}"""
     
     def _create_fallback_response(self) -> Dict[str, Any]:
         """Create safe fallback response when LLM analysis fails."""
@@ -635,12 +760,18 @@ Do not include any other text or explanation, only the JSON response."""
         # Gradual rollout support
         rollout_percentage = int(os.getenv("LLM_REFERENCE_ROLLOUT_PERCENTAGE", "100"))
         if rollout_percentage < 100:
-            import random
             if random.randint(1, 100) > rollout_percentage:
                 return False
         
         return use_llm
 
+def get_reference_analyzer(model: str = "gpt-4o-mini") -> LLMReferenceAnalyzer:
+    """Get the process-wide reference analyzer for a model."""
+    analyzer = _reference_analyzers.get(model)
+    if analyzer is None:
+        analyzer = _reference_analyzers[model] = LLMReferenceAnalyzer(model)
+    return analyzer
+
 class ChatAgent:
     """Specialized agent for natural conversation and user interaction."""
     
@@ -648,6 +779,7 @@ class ChatAgent:
         self.project_slug = project_slug
         self.model = model
         self.llm = None  # Lazy initialization
+        self._http_client = None  # Shared HTTP client the LLM was built on
         self.conversation_memory = None
         self.markdown_memory = None
     
@@ -664,16 +796,20 @@ class ChatAgent:
         
         logger.info(f"ChatAgent initialized for {self.project_slug} with {len(memory_context['messages'])} conversation messages")
         
-        # Initialize LLM only if we have an API key
-        if self.llm is None:
+        # Initialize LLM only if we have an API key; rebuild when the shared HTTP client was replaced
+        http_client = get_shared_http_client()
+        if self.llm is None or self._http_client is not http_client:
             api_key = self._get_openai_api_key()
             if api_key:
                 self.llm = ChatOpenAI(
                     model=self.model,
                     temperature=0.1,
                     streaming=True,
-                    api_key=api_key
+                    api_key=api_key,
+                    timeout=LLM_REQUEST_TIMEOUT,
+                    http_async_client=http_client
                 )
+                self._http_client = http_client
                 logger.info(f"Initialized ChatOpenAI with model {self.model}")
             else:
                 logger.warning(f"No API key available, ChatAgent will use fallback responses")
@@ -783,7 +919,7 @@ Focus on being a knowledgeable project planning consultant who guides through co
                     
                     # Log the last few messages for debugging
                     for i, msg in enumerate(conversation_messages[-4:]):
-                        role = "User" if hasattr(msg, '__class__') and 'Human' in msg.__class__.__name__ else "Assistant"
+                        role = "User" if isinstance(msg, HumanMessage) else "Assistant"
                         logger.info(f"MEMORY DEBUG: Recent message {i}: {role}: {msg.content[:100]}...")
                         
                 except Exception as e:
@@ -852,15 +988,7 @@ You are continuing this conversation with full awareness of previous exchanges.
         """Generate a fallback response when LLM is not available."""
         
         # Check if this looks like a reference to add something to document
-        user_lower = user_message.lower()
-        reference_keywords = [
-            "add that", "add those", "include that", "include those", 
-            "use that", "apply that", "implement that", "add this",
-            "those metrics", "that information", "the metrics", "the details",
-            "what you mentioned", "what you suggested", "your recommendation"
-        ]
-        
-        if any(keyword in user_lower for keyword in reference_keywords):
+        if REFERENCE_KEYWORDS_PATTERN.search(user_message):
             if reference_context:
                 return f"I understand you'd like to add the information we just discussed to the document. I've noted your request and the relevant information will be processed for document updates."
             else:
@@ -882,11 +1010,12 @@ You are continuing this conversation with full awareness of previous exchanges.
             system_prompt = await self.get_system_prompt()
             
             # Build context string from conversation messages
-            conversation_context = ""
+            context_parts = []
             if conversation_messages:
                 for msg in conversation_messages[-10:]:  # Last 10 messages
-                    role = "User" if hasattr(msg, '__class__') and 'Human' in msg.__class__.__name__ else "Assistant"
-                    conversation_context += f"{role}: {msg.content[:500]}...\n\n"
+                    role = "User" if isinstance(msg, HumanMessage) else "Assistant"
+                    context_parts.append(f"{role}: {msg.content[:500]}...\n\n")
+            conversation_context = "".join(context_parts)
             
             # Build enhanced context for chat agent
             reference_section = ""
@@ -946,6 +1075,43 @@ You are continuing this conversation with full awareness of previous exchanges.
             logger.error(f"Error in chat_with_context: {e}", exc_info=True)
             return "I apologize, but I encountered an error processing your message. Could you please try rephrasing your question?"
     
+# Static instructions for InfoAgent's detailed reference analysis, kept ahead of
+# the per-turn content for the same prompt-prefix reuse
+ENHANCED_REFERENCE_ANALYSIS_INSTRUCTIONS = """You are analyzing a user message to determine detailed references and extract specific information.
+
+You will be given the CONVERSATION CONTEXT, the MOST RECENT AI RESPONSE and the CURRENT USER MESSAGE.
+
+Analyze the user's message for:
+
+1. **References to Previous Content**: What specifically are they referring to?
+2. **New Technical Information**: Specific details, requirements, specifications
+3. **Action Requests**: What do they want done with the information?
+4. **Context Clues**: Implicit information that should be captured
+
+Return detailed JSON:
+{
+    "has_reference": true/false,
+    "reference_type": "explicit/implicit/pronoun/contextual",
+    "referenced_content": {
+        "specific_items": ["list of specific items referenced"],
+        "technical_details": ["technical specifications mentioned"],
+        "requirements": ["specific requirements stated"]
+    },
+    "new_information": {
+        "technical_specs": ["new technical information provided"],
+        "requirements": ["new requirements mentioned"],
+        "constraints": ["limitations or constraints mentioned"],
+        "processes": ["processes or methodologies mentioned"],
+        "metrics": ["specific numbers, percentages, or measurements"]
+    },
+    "action_requested": "what they want done with the information",
+    "confidence": "high/medium/low",
+    "extraction_priority": "high/medium/low"
+}
+
+Focus on capturing specific, actionable information rather than general statements.
+"""
+
 class InfoAgent:
     """Specialized agent for extracting information and updating documents."""
     
@@ -953,9 +1119,12 @@ class InfoAgent:
         self.project_slug = project_slug
         self.model = model
         self.llm = None  # Lazy initialization
+        self._http_client = None  # Shared HTTP client the LLM was built on
         self.conversation_memory = None
         self.markdown_memory = None
         self.llm_analyzer = None
+        # Digest of the extraction inputs -> extraction result, so the same turn is not extracted twice
+        self._extract_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     async def initialize(self, conversation_memory_or_user_id=None, markdown_memory=None):
         """Initialize agent with memory instances (supports both legacy and unified)."""
@@ -987,19 +1156,23 @@ class InfoAgent:
         # Only initialize LLM analyzer if we have an API key
         api_key = self._get_openai_api_key() 
         if api_key:
-            self.llm_analyzer = LLMReferenceAnalyzer(self.model)
+            self.llm_analyzer = get_reference_analyzer(self.model)
         else:
             self.llm_analyzer = None
         
-        # Initialize LLM only if we have an API key
-        if self.llm is None:
+        # Initialize LLM only if we have an API key; rebuild when the shared HTTP client was replaced
+        http_client = get_shared_http_client()
+        if self.llm is None or self._http_client is not http_client:
             api_key = self._get_openai_api_key()
             if api_key:
                 self.llm = ChatOpenAI(
                     model=self.model,
                     temperature=0.1,
-                    api_key=api_key
+                    api_key=api_key,
+                    timeout=LLM_REQUEST_TIMEOUT,
+                    http_async_client=http_client
                 )
+                self._http_client = http_client
                 logger.info(f"Initialized InfoAgent LLM with model {self.model}")
             else:
                 logger.warning(f"No API key available, InfoAgent will skip document extraction")
@@ -1079,6 +1252,21 @@ You capture the detailed information that makes projects executable, not just un
             
             logger.info(f"Enhanced info agent analyzing conversation for {self.project_slug}")
             
+            # Get current document context
+            current_document = await self.markdown_memory.get_document_context()
+            
+            # The same turn is extracted again right after should_update_document; the
+            # document is part of the key, so any update in between forces a fresh extraction
+            cache_key = hashlib.blake2b(
+                "\x00".join((self.model, user_input, ai_response, conversation_context, current_document)).encode(),
+                digest_size=16
+            ).hexdigest()
+            cached = self._extract_cache.get(cache_key)
+            if cached is not None:
+                self._extract_cache.move_to_end(cache_key)
+                logger.debug("Using cached document extraction")
+                return copy.deepcopy(cached)
+            
             # Enhanced reference analyzer
             if self.llm_analyzer:
                 reference_analysis = await self._enhanced_reference_analyzer(
@@ -1095,9 +1283,6 @@ You capture the detailed information that makes projects executable, not just un
                     "extraction_priority": "low"
                 }
             
-            # Get current document context
-            current_document = await self.markdown_memory.get_document_context()
-            
             # Enhanced extraction prompt for detailed information capture
             extraction_prompt = f"""You are an expert information extraction agent responsible for capturing detailed, specific project information from conversations.
 
@@ -1231,6 +1416,10 @@ Capture ALL specific details, technical specifications, exact requirements, and
                     logger.info(f"Extracted {len(extracted_details)} specific details: {extracted_details[:3]}...")
                 
                 logger.info(f"Enhanced info agent extracted data: {extraction_data.get('reasoning', 'No reasoning provided')}")
+                
+                self._extract_cache[cache_key] = copy.deepcopy(extraction_data)
+                if len(self._extract_cache) > EXTRACTION_CACHE_SIZE:
+                    self._extract_cache.popitem(last=False)
                 return extraction_data
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse enhanced info agent response: {e}")
@@ -1243,50 +1432,20 @@ Capture ALL specific details, technical specifications, exact requirements, and
     async def _enhanced_reference_analyzer(self, user_message: str, conversation_context: str, last_ai_response: str) -> Dict[str, Any]:
         """Enhanced LLM-powered reference detection with detailed analysis."""
         
-        analysis_prompt = f"""You are analyzing a user message to determine detailed references and extract specific information.
-
-CONVERSATION CONTEXT:
+        analysis_prompt = f"""CONVERSATION CONTEXT:
 {conversation_context}
 
 MOST RECENT AI RESPONSE:
 {last_ai_response}
 
 CURRENT USER MESSAGE:
-{user_message}
-
-Analyze the user's message for:
-
-1. **References to Previous Content**: What specifically are they referring to?
-2. **New Technical Information**: Specific details, requirements, specifications
-3. **Action Requests**: What do they want done with the information?
-4. **Context Clues**: Implicit information that should be captured
-
-Return detailed JSON:
-{{
-    "has_reference": true/false,
-    "reference_type": "explicit/implicit/pronoun/contextual",
-    "referenced_content": {{
-        "specific_items": ["list of specific items referenced"],
-        "technical_details": ["technical specifications mentioned"],
-        "requirements": ["specific requirements stated"]
-    }},
-    "new_information": {{
-        "technical_specs": ["new technical information provided"],
-        "requirements": ["new requirements mentioned"],
-        "constraints": ["limitations or constraints mentioned"],
-        "processes": ["processes or methodologies mentioned"],
-        "metrics": ["specific numbers, percentages, or measurements"]
-    }},
-    "action_requested": "what they want done with the information",
-    "confidence": "high/medium/low",
-    "extraction_priority": "high/medium/low"
-}}
-
-Focus on capturing specific, actionable information rather than general statements.
-"""
+{user_message}"""
         
         try:
-            messages = [SystemMessage(content=analysis_prompt)]
+            messages = [
+                SystemMessage(content=ENHANCED_REFERENCE_ANALYSIS_INSTRUCTIONS),
+                HumanMessage(content=analysis_prompt)
+            ]
             response = await self.llm.ainvoke(messages)
             return json.loads(response.content)
         except Exception as e:
@@ -1426,8 +1585,7 @@ Generate ONLY the Executive Summary content (no headers, no formatting - just th
             has_updates = len(updates) > 0 or len(extracted_details) > 0
             
             # Also return True if the reasoning suggests document updates are needed
-            update_keywords = ["add", "update", "document", "section", "include", "insert"]
-            reasoning_suggests_updates = any(keyword in reasoning.lower() for keyword in update_keywords)
+            reasoning_suggests_updates = UPDATE_KEYWORDS_PATTERN.search(reasoning) is not None
             
             should_update = has_updates or reasoning_suggests_updates
             
@@ -1563,7 +1721,7 @@ class AgentCoordinator:
         # Initialize modern LLM reference detector if we have an API key
         api_key = os.getenv("OPENAI_API_KEY", "")
         if api_key:
-            self.llm_reference_detector = LLMReferenceAnalyzer(model=model)
+            self.llm_reference_detector = get_reference_analyzer(model)
             self.context_builder = None  # Functionality integrated into LLMReferenceAnalyzer
         else:
             self.llm_reference_detector = None
@@ -1625,7 +1783,7 @@ class AgentCoordinator:
                     logger.info(f"DEBUG: LLM Reference analysis: {reference_analysis.explanation}")
                     logger.info(f"DEBUG: Has reference: {reference_analysis.has_reference}, Confidence: {reference_analysis.confidence}")
                     
-                    if reference_analysis.has_reference and reference_analysis.confidence in ["high", "medium"]:
+                    if reference_analysis.has_reference and reference_analysis.confidence in ACTIONABLE_REFERENCE_CONFIDENCE:
                         # Build rich context using the detected reference
                         reference_context = self.context_builder.build_context_for_reference(
                             current_message=user_message,
@@ -1648,7 +1806,7 @@ class AgentCoordinator:
                         )
                         logger.info(f"DEBUG: Fallback reference analysis: {reference_analysis.explanation}")
                         
-                        if reference_analysis.has_reference and reference_analysis.confidence in ["high", "medium"]:
+                        if reference_analysis.has_reference and reference_analysis.confidence in ACTIONABLE_REFERENCE_CONFIDENCE:
                             reference_context = self.context_builder.build_context_for_reference(
                                 current_message=user_message,
                                 conversation_history=conversation_messages,
@@ -1664,13 +1822,13 @@ class AgentCoordinator:
                 logger.info("DEBUG: No LLM reference detector available, using basic rule-based detection")
                 try:
                     # Use the LLMReferenceAnalyzer that's already defined in this file
-                    temp_detector = LLMReferenceAnalyzer(model="gpt-4o-mini")  # Fallback analyzer
+                    temp_detector = get_reference_analyzer("gpt-4o-mini")  # Fallback analyzer
                     reference_analysis = temp_detector._fallback_reference_detection(
                         user_message, conversation_messages
                     )
                     logger.info(f"DEBUG: Basic reference analysis: {reference_analysis.explanation}")
                     
-                    if reference_analysis.has_reference and reference_analysis.confidence in ["high", "medium"]:
+                    if reference_analysis.has_reference and reference_analysis.confidence in ACTIONABLE_REFERENCE_CONFIDENCE:
                         # Context building is now integrated into LLMReferenceAnalyzer
                         context_builder = None  # Not needed - functionality integrated
                         reference_context = context_builder.build_context_for_reference(
@@ -1760,16 +1918,17 @@ class AgentCoordinator:
             # Use LLM reference detector for context awareness if available
             if self.llm_reference_detector:
                 # Get conversation context string
-                conversation_context = ""
+                context_parts = []
                 if conversation_messages:
                     for msg in conversation_messages[-5:]:  # Last 5 messages for context
-                        role = "User" if hasattr(msg, '__class__') and 'Human' in msg.__class__.__name__ else "Assistant"
-                        conversation_context += f"{role}: {msg.content}\n\n"
+                        role = "User" if isinstance(msg, HumanMessage) else "Assistant"
+                        context_parts.append(f"{role}: {msg.content}\n\n")
+                conversation_context = "".join(context_parts)
                 
                 # Get last AI response
                 last_ai_response = ""
                 for msg in reversed(conversation_messages):
-                    if hasattr(msg, '__class__') and 'AI' in msg.__class__.__name__:
+                    if isinstance(msg, AIMessage):
                         last_ai_response = msg.content
                         break
                 
@@ -1784,8 +1943,7 @@ class AgentCoordinator:
                     logger.info("Message is conversational - will focus on chat response")
             else:
                 # Fallback: assume context needed for project-specific queries
-                needs_context = any(word in user_message.lower() for word in 
-                                  ['project', 'document', 'section', 'update', 'what', 'how', 'when', 'where'])
+                needs_context = CONTEXT_KEYWORDS_PATTERN.search(user_message) is not None
             
             # Build reference context from analysis results
             reference_context_for_chat = None
@@ -1923,7 +2081,6 @@ class LegacyMemoryWrapper:
                     return
             
             # Fallback to modern memory (only if no running loop)
-            import asyncio
             try:
                 asyncio.get_running_loop()
                 logger.debug("Event loop already running, using empty last AI response")
@@ -2003,7 +2160,6 @@ class LegacyMemoryWrapper:
             
             # If cache is empty, try to sync from modern memory (only if no running loop)
             if not messages:
-                import asyncio
                 try:
                     asyncio.get_running_loop()
                     logger.debug("Event loop running, using empty context")
@@ -2026,15 +2182,15 @@ class LegacyMemoryWrapper:
             if not messages:
                 return "No conversation history available."
             
-            formatted_context = ""
+            context_parts = []
             for msg in messages:
                 if isinstance(msg, HumanMessage):
-                    formatted_context += f"User: {msg.content}\n"
+                    context_parts.append(f"User: {msg.content}\n")
                 elif isinstance(msg, AIMessage):
-                    formatted_context += f"Assistant: {msg.content}\n"
-                formatted_context += "\n"
+                    context_parts.append(f"Assistant: {msg.content}\n")
+                context_parts.append("\n")
             
-            return formatted_context.strip()
+            return "".join(context_parts).strip()
             
         except Exception as e:
             logger.error(f"Error formatting conversation context via wrapper: {e}")
@@ -2048,7 +2204,6 @@ class LegacyMemoryWrapper:
             
             # If cache is empty, try modern memory (only if no running loop)
             if not messages:
-                import asyncio
                 try:
                     asyncio.get_running_loop()
                     logger.debug("Event loop running, returning empty messages")
@@ -2272,15 +2427,15 @@ class ConversationMemory:
             if not messages:
                 return "No conversation history available."
             
-            formatted_context = ""
+            context_parts = []
             for msg in messages:
-                if hasattr(msg, '__class__') and 'Human' in msg.__class__.__name__:
-                    formatted_context += f"User: {msg.content}\n"
-                elif hasattr(msg, '__class__') and 'AI' in msg.__class__.__name__:
-                    formatted_context += f"Assistant: {msg.content}\n"
-                formatted_context += "\n"
+                if isinstance(msg, HumanMessage):
+                    context_parts.append(f"User: {msg.content}\n")
+                elif isinstance(msg, AIMessage):
+                    context_parts.append(f"Assistant: {msg.content}\n")
+                context_parts.append("\n")
             
-            return formatted_context.strip()
+            return "".join(context_parts).strip()
             
         except Exception as e:
             logger.error(f"Error formatting conversation context: {e}")
@@ -2352,6 +2507,8 @@ class MarkdownMemory:
         self.file_path = MEMORY_DIR / f"{project_slug}.md"
         self._lock = asyncio.Lock()
         # Removed FileLock - now using async-safe file operations
+        # Section updates waiting for the lock; drained together into one read/write
+        self._pending_updates: List[Tuple[str, str, str, str, asyncio.Event]] = []
         
         # Session-based changelog tracking
         self._session_start_time = None
@@ -2501,32 +2658,46 @@ _Last updated: {current_time}_
         try:
             logger.info(f"Adding to section '{section}' for {self.project_slug} by {contributor} ({user_id})")
             
+            # Queue the update; whichever caller takes the lock first applies every queued
+            # update in order with one read and one write, so concurrent writers share the I/O
+            done = asyncio.Event()
+            self._pending_updates.append((section, content, contributor, user_id, done))
+            
             # Use async lock for coordination
             async with self._lock:
-                await self.ensure_file_exists()
-                
-                # Read content using async-safe utility
-                current_content = await safe_file_read(self.file_path)
-                if current_content is None:
-                    current_content = ""
-                logger.debug(f"Current content length before update: {len(current_content)}")
-                
-                updated_content = await self._update_markdown_section(
-                    current_content, section, content, contributor, user_id
-                )
-                
-                logger.debug(f"Updated content length after update: {len(updated_content)}")
-                
-                # Check if we need to finalize an expired session before writing
-                if self._session_start_time and self._session_sections_updated:
-                    session_duration = datetime.now().timestamp() - self._session_start_time
-                    if session_duration > self._session_timeout:
-                        logger.info("Session timeout reached, finalizing changelog")
-                        updated_content = await self._finalize_session_changelog(updated_content)
-                
-                await safe_file_write(self.file_path, updated_content)
-                
-                logger.info(f"Successfully added to section '{section}' for {self.project_slug}")
+                if done.is_set():
+                    return
+                batch, self._pending_updates = self._pending_updates, []
+                try:
+                    await self.ensure_file_exists()
+                    
+                    # Read content using async-safe utility
+                    current_content = await safe_file_read(self.file_path)
+                    if current_content is None:
+                        current_content = ""
+                    logger.debug(f"Current content length before update: {len(current_content)}")
+                    
+                    updated_content = current_content
+                    for batch_section, batch_content, batch_contributor, batch_user_id, _ in batch:
+                        updated_content = await self._update_markdown_section(
+                            updated_content, batch_section, batch_content, batch_contributor, batch_user_id
+                        )
+                    
+                    logger.debug(f"Updated content length after {len(batch)} update(s): {len(updated_content)}")
+                    
+                    # Check if we need to finalize an expired session before writing
+                    if self._session_start_time and self._session_sections_updated:
+                        session_duration = datetime.now().timestamp() - self._session_start_time
+                        if session_duration > self._session_timeout:
+                            logger.info("Session timeout reached, finalizing changelog")
+                            updated_content = await self._finalize_session_changelog(updated_content)
+                    
+                    await safe_file_write(self.file_path, updated_content)
+                    
+                    logger.info(f"Successfully added {len(batch)} update(s) including section '{section}' for {self.project_slug}")
+                finally:
+                    for *_, batch_done in batch:
+                        batch_done.set()
         except Exception as e:
             logger.error(f"Error updating section '{section}': {e}")
             # Don't let document update errors break the user experience
@@ -2569,14 +2740,7 @@ _Last updated: {current_time}_
         
         # Add session entry to Change Log
         change_entry = f"| {session_start} - {current_time} | {self._session_contributor} | {self._session_user_id} | {summary} |"
-        change_log_pattern = r'(## Change Log.*?\n\|.*?\n\|.*?\n)'
-        if re.search(change_log_pattern, content, re.DOTALL):
-            content = re.sub(
-                change_log_pattern,
-                rf'\1{change_entry}\n',
-                content,
-                flags=re.DOTALL
-            )
+        content = CHANGE_LOG_TABLE_HEADER_PATTERN.sub(rf'\1{change_entry}\n', content)
         
         logger.info(f"Finalized session changelog for {self._session_contributor}: {summary}")
         
@@ -2624,16 +2788,12 @@ _Last updated: {current_time}_
         """Update a specific section in the markdown content by appending new information."""
         # Update the "Last updated" timestamp
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        content = re.sub(
-            r'_Last updated: .*?_',
-            f'_Last updated: {current_time}_',
-            content
-        )
+        content = LAST_UPDATED_PATTERN.sub(f'_Last updated: {current_time}_', content)
         
         # Find and update the section
-        section_pattern = rf'(## {re.escape(section)})(.*?)(?=## |\Z)'
+        section_pattern = _section_pattern(section)
         
-        if re.search(section_pattern, content, re.DOTALL):
+        if section_pattern.search(content):
             # Section exists - APPEND new content instead of replacing
             def replace_section(match):
                 section_header = match.group(1)
@@ -2644,18 +2804,12 @@ _Last updated: {current_time}_
                     existing_content = existing_content[:-3].strip()
                 
                 # Skip empty or placeholder content
-                placeholder_patterns = [
-                    r'^\*[^*]*\*$',  # *placeholder text*
-                    r'^- \[ \].*$',   # - [ ] placeholder tasks
-                    r'^_[^_]*_$'      # _placeholder text_
-                ]
-                
                 lines = existing_content.split('\n')
                 filtered_lines = []
                 
                 for line in lines:
                     line = line.strip()
-                    if line and not any(re.match(p, line) for p in placeholder_patterns):
+                    if line and not PLACEHOLDER_LINE_PATTERN.match(line):
                         filtered_lines.append(line)
                 
                 # Combine existing content with new content
@@ -2666,14 +2820,13 @@ _Last updated: {current_time}_
                 
                 return f"{section_header}\n{combined_content}\n\n---\n\n"
             
-            content = re.sub(section_pattern, replace_section, content, flags=re.DOTALL)
+            content = section_pattern.sub(replace_section, content)
             logger.debug(f"Appended to existing section '{section}'")
         else:
             # Section doesn't exist, add it before Change Log (Enhanced dynamic section creation)
-            change_log_pattern = r'(## Change Log.*)'
-            if re.search(change_log_pattern, content, re.DOTALL):
+            if CHANGE_LOG_SECTION_PATTERN.search(content):
                 new_section = f"## {section}\n{new_content.strip()}\n\n---\n\n"
-                content = re.sub(change_log_pattern, new_section + r'\1', content, flags=re.DOTALL)
+                content = CHANGE_LOG_SECTION_PATTERN.sub(new_section + r'\1', content)
                 logger.debug(f"Added new section '{section}' with enhanced dynamic creation")
             else:
                 # No change log found, append to end
@@ -2697,26 +2850,21 @@ _Last updated: {current_time}_
         """Replace entire section content - only for explicit replacement requests."""
         # Update the "Last updated" timestamp
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        content = re.sub(
-            r'_Last updated: .*?_',
-            f'_Last updated: {current_time}_',
-            content
-        )
+        content = LAST_UPDATED_PATTERN.sub(f'_Last updated: {current_time}_', content)
         
         # Find and replace the section
-        section_pattern = rf'(## {re.escape(section)})(.*?)(?=## |\Z)'
+        section_pattern = _section_pattern(section)
         
-        if re.search(section_pattern, content, re.DOTALL):
+        if section_pattern.search(content):
             # Section exists - REPLACE entire content (explicit replacement)
             replacement = f"## {section}\n{new_content.strip()}\n\n---\n\n"
-            content = re.sub(section_pattern, replacement, content, flags=re.DOTALL)
+            content = section_pattern.sub(replacement, content)
             logger.debug(f"REPLACED entire section '{section}' content")
         else:
             # Section doesn't exist, add it before Change Log
-            change_log_pattern = r'(## Change Log.*)'
-            if re.search(change_log_pattern, content, re.DOTALL):
+            if CHANGE_LOG_SECTION_PATTERN.search(content):
                 new_section = f"## {section}\n{new_content.strip()}\n\n---\n\n"
-                content = re.sub(change_log_pattern, new_section + r'\1', content, flags=re.DOTALL)
+                content = CHANGE_LOG_SECTION_PATTERN.sub(new_section + r'\1', content)
                 logger.debug(f"Added new section '{section}'")
         
         # Session-based changelog tracking
@@ -2837,15 +2985,31 @@ _Last updated: {current_time}_
 class ProjectRegistry:
     """Manages the index.json file that tracks all projects."""
     
+    # (index path, file version, parsed index) from the last read of an unchanged file
+    _index_cache: Optional[Tuple[Path, Tuple[int, int], Dict[str, Any]]] = None
+    
     @staticmethod
     async def load_index() -> Dict[str, Any]:
         """Load the project index."""
+        # Re-parse only when the file changed; callers mutate the result, so hand out copies
+        version = await safe_file_version(INDEX_FILE)
+        if version is None:
+            return {}
+        
+        cached = ProjectRegistry._index_cache
+        if cached is not None and cached[0] == INDEX_FILE and cached[1] == version:
+            return copy.deepcopy(cached[2])
+        
         content = await safe_json_read(INDEX_FILE)
-        return content if content is not None else {}
+        if content is None:
+            return {}
+        ProjectRegistry._index_cache = (INDEX_FILE, version, content)
+        return copy.deepcopy(content)
     
     @staticmethod
     async def save_index(index: Dict[str, Any]) -> None:
         """Save the project index."""
+        ProjectRegistry._index_cache = None
         INDEX_FILE.parent.mkdir(exist_ok=True)
         await safe_json_write(INDEX_FILE, index)
     
@@ -2976,7 +3140,9 @@ def make_graph(project_slug: str, model: str = "gpt-4o-mini") -> StateGraph:
         model=model,
         temperature=0.1,
         streaming=True,
-        api_key=get_openai_api_key()
+        api_key=get_openai_api_key(),
+        timeout=LLM_REQUEST_TIMEOUT,
+        http_async_client=get_shared_http_client()
     )
     
     # Phase 2: Memory will be initialized dynamically in planning_node
@@ -3044,6 +3210,9 @@ def make_graph(project_slug: str, model: str = "gpt-4o-mini") -> StateGraph:
     
     return workflow.compile()
 
+# Pause between streamed tokens so clients render the response progressively
+STREAM_TOKEN_DELAY = 0.01
+
 async def stream_initial_message(
     project_slug: str,
     user_id: str = "anonymous"
@@ -3074,9 +3243,8 @@ This process creates a living Markdown document that any teammate can extend in
 To get started, could you please provide your name, role, and areas of expertise?"""
             
             # Stream the introduction message token by token
-            for token in introduction_message:
-                yield f"data: {json.dumps({'token': token})}\n\n"
-                await asyncio.sleep(0.01)  # Small delay for smoother streaming
+            async for event in stream_text_events(introduction_message, STREAM_TOKEN_DELAY):
+                yield event
                 
             # Store the initial message in conversation memory
             await conversation_memory.add_conversation("", introduction_message, "system")
@@ -3088,33 +3256,31 @@ To get started, could you please provide your name, role, and areas of expertise
             else:
                 welcome_message = f"Welcome back to {project_slug.replace('-', ' ').title()}! How can I help you continue developing this project?"
             
-            for token in welcome_message:
-                yield f"data: {json.dumps({'token': token})}\n\n"
-                await asyncio.sleep(0.01)
+            async for event in stream_text_events(welcome_message, STREAM_TOKEN_DELAY):
+                yield event
         
         # End the stream
-        yield f"data: {json.dumps({'done': True})}\n\n"
+        yield sse_event({'done': True})
         
         logger.info(f"Completed context-aware initial message stream for {project_slug}")
         
     except ValueError as e:
         logger.warning(f"Invalid input for stream_initial_message: {e}")
         error_message = "Welcome! I'm here to help you develop your project. Please tell me about what you'd like to work on."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
+        async for event in stream_text_events(error_message):
+            yield event
     except OSError as e:
         logger.error(f"Database/file error in stream_initial_message: {e}")
         error_message = "Welcome! I'm here to help you develop your project. Please tell me about what you'd like to work on."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
+        async for event in stream_text_events(error_message):
+            yield event
     except Exception as e:
         logger.error(f"Unexpected error in context-aware stream_initial_message: {e}", exc_info=True)
         # Always provide some response to the user
         error_message = "Welcome! I'm here to help you develop your project. Please tell me about what you'd like to work on."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
-            await asyncio.sleep(0.01)
-        yield f"data: {json.dumps({'done': True})}\n\n"
+        async for event in stream_text_events(error_message, STREAM_TOKEN_DELAY):
+            yield event
+        yield sse_event({'done': True})
 
 async def stream_chat_response(
     project_slug: str, 
@@ -3148,28 +3314,25 @@ async def stream_chat_response(
                 logger.info(f"Streaming context-aware response: {len(content)} characters")
                 
                 # Stream token by token
-                for token in content:
-                    yield f"data: {json.dumps({'token': token})}\n\n"
-                    await asyncio.sleep(0.01)  # Small delay for smoother streaming
+                async for event in stream_text_events(content, STREAM_TOKEN_DELAY):
+                    yield event
                     
                 logger.info(f"Successfully streamed conversation-aware response for {project_slug}")
             else:
                 logger.warning("Final message has no content")
                 # Provide fallback response
                 fallback = "I'm ready to help with your project planning. What would you like to know?"
-                for token in fallback:
-                    yield f"data: {json.dumps({'token': token})}\n\n"
-                    await asyncio.sleep(0.01)
+                async for event in stream_text_events(fallback, STREAM_TOKEN_DELAY):
+                    yield event
         else:
             logger.warning("No final result from graph execution")
             # Provide fallback response
             fallback = "I'm here to help with your project. How can I assist you today?"
-            for token in fallback:
-                yield f"data: {json.dumps({'token': token})}\n\n"
-                await asyncio.sleep(0.01)
+            async for event in stream_text_events(fallback, STREAM_TOKEN_DELAY):
+                yield event
         
         # End the stream
-        yield f"data: {json.dumps({'done': True})}\n\n"
+        yield sse_event({'done': True})
         
         # Schedule session finalization after a delay (for session cleanup)
         try:
@@ -3182,26 +3345,25 @@ async def stream_chat_response(
     except ValueError as e:
         logger.warning(f"Invalid input for stream_chat_response: {e}")
         error_message = "I apologize, but there was an issue with your request. Please check your input and try again."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
+        async for event in stream_text_events(error_message):
+            yield event
     except OSError as e:
         logger.error(f"Database/file error in stream_chat_response: {e}")
         error_message = "I apologize, but I'm having trouble accessing project data. Please try again in a moment."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
+        async for event in stream_text_events(error_message):
+            yield event
     except ImportError as e:
         logger.error(f"Missing dependency for stream_chat_response: {e}")
         error_message = "I apologize, but I'm experiencing a system error. Please contact support if this continues."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
+        async for event in stream_text_events(error_message):
+            yield event
     except Exception as e:
         logger.error(f"Unexpected error in context-aware stream_chat_response: {e}", exc_info=True)
         # Always provide some response to the user
         error_message = "I apologize, but I encountered an error. Please try your request again."
-        for token in error_message:
-            yield f"data: {json.dumps({'token': token})}\n\n"
-            await asyncio.sleep(0.01)
-        yield f"data: {json.dumps({'done': True})}\n\n"
+        async for event in stream_text_events(error_message, STREAM_TOKEN_DELAY):
+            yield event
+        yield sse_event({'done': True})
 
 async def _delayed_session_cleanup(project_slug: str, user_id: str, delay_seconds: int = 60):
     """Delayed session cleanup - finalize sessions after user inactivity."""
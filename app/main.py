@@ -9,9 +9,9 @@ from fastapi.responses import StreamingResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, validator
 import os
-import json
 import asyncio
 import logging
+import re
 import time
 import uuid
 from datetime import datetime
@@ -126,6 +126,12 @@ cors_warnings = CORSConfig.validate_cors_config()
 for warning in cors_warnings:
     module_logger.warning(f"CORS Security Warning: {warning}")
 
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close the shared OpenAI HTTP client on the loop that served requests."""
+    from .langgraph_runner import close_shared_http_client
+    await close_shared_http_client()
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -197,7 +203,6 @@ class UserRegistrationRequest(BaseModel):
     @validator('first_name', 'last_name')
     def validate_names(cls, v):
         # Sanitize names
-        import re
         sanitized = re.sub(r'[^a-zA-Z\s\'-]', '', v.strip())
         if not sanitized or len(sanitized) < 1:
             raise ValueError("Name cannot be empty or contain only special characters")
@@ -552,6 +557,7 @@ async def chat_with_project(slug: str, request: ChatRequest, http_request: Reque
         if use_openai_agents:
             # OpenAI Agents SDK Integration
             from .openai_agents_runner import get_openai_runner
+            from .core.streaming import sse_event, stream_text_events
             
             async def stream_agent_response():
                 """Stream OpenAI Agents SDK responses."""
@@ -563,20 +569,19 @@ async def chat_with_project(slug: str, request: ChatRequest, http_request: Reque
                     
                     if result['success']:
                         # Stream the response character by character in JSON format
-                        response_text = result['response']
-                        for char in response_text:
-                            yield f"data: {json.dumps({'token': char})}\n\n"
-                        yield f"data: {json.dumps({'done': True})}\n\n"
+                        async for event in stream_text_events(result['response']):
+                            yield event
+                        yield sse_event({'done': True})
                     else:
                         # Stream error message
                         error_msg = f"Error: {result.get('error', 'Unknown error')}"
-                        yield f"data: {json.dumps({'error': error_msg})}\n\n"
+                        yield sse_event({'error': error_msg})
                     
                     yield "data: [DONE]\n\n"
                 except Exception as e:
                     logger.error(f"OpenAI Agents error: {e}")
                     error_msg = f"Error: {str(e)}"
-                    yield f"data: {json.dumps({'error': error_msg})}\n\n"
+                    yield sse_event({'error': error_msg})
             
             return StreamingResponse(
                 stream_agent_response(),
@@ -617,6 +622,8 @@ async def get_initial_message(slug: str, user_id: str = "anonymous", http_reques
         
         if use_openai_agents:
             # OpenAI Agents SDK: Simple welcome message
+            from .core.streaming import sse_event, stream_text_events
+            
             async def stream_openai_initial_message():
                 """Simple initial message for OpenAI Agents SDK."""
                 try:
@@ -624,16 +631,16 @@ async def get_initial_message(slug: str, user_id: str = "anonymous", http_reques
                     welcome_message = f"Welcome to {slug.replace('-', ' ').title()}! I'm here to help you with your project planning. What would you like to work on?"
                     
                     # Stream character by character in JSON format like the chat endpoint
-                    for char in welcome_message:
-                        yield f"data: {json.dumps({'token': char})}\n\n"
+                    async for event in stream_text_events(welcome_message):
+                        yield event
                     
-                    yield f"data: {json.dumps({'done': True})}\n\n"
+                    yield sse_event({'done': True})
                     
                 except Exception as e:
                     logger.error(f"Error in OpenAI initial message: {e}")
                     error_message = "Hello! I'm ready to help with your project."
-                    for char in error_message:
-                        yield f"data: {char}\n\n"
+                    async for event in stream_text_events(error_message):
+                        yield event
                     yield "data: [DONE]\n\n"
             
             return StreamingResponse(
@@ -11,6 +11,7 @@ This module provides the new agent system using OpenAI Agents SDK with:
 import os
 import asyncio
 import re
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, AsyncGenerator, Dict, Any, List
 import aiofiles
@@ -20,6 +21,10 @@ from agents import Agent, Runner, SQLiteSession, function_tool, handoff, RunCont
 
 logger = logging.getLogger(__name__)
 
+# Project document patterns scanned when rebuilding conversation context from markdown
+CHANGE_LOG_ROW_PATTERN = re.compile(r'\| (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| ([^|]+) \| ([^|]+) \| ([^|]+) \|')
+RECENT_UPDATES_PATTERN = re.compile(r'## Recent Updates\s*\n(.*?)(?=\n##|\n---|$)', re.DOTALL)
+
 
 # Define standalone function tools (required by OpenAI Agents SDK)
 @function_tool
@@ -40,9 +45,6 @@ async def update_project_document(
         Confirmation message about the update
     """
     try:
-        import re
-        from datetime import datetime
-        
         file_path = Path(f"app/memory/{project_slug}.md")
         
         # Read existing content
@@ -170,9 +172,6 @@ You are the "Conversational NAI Problem-Definition Assistant," a professional, p
         Returns:
             Updated markdown content
         """
-        import re
-        from datetime import datetime
-        
         # Add timestamp for tracking
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
@@ -441,8 +440,7 @@ CRITICAL TOOL USAGE:
             # context from Change Log entries and Recent Updates
             
             # Look for conversation patterns in Change Log
-            change_log_pattern = r'\| (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| ([^|]+) \| ([^|]+) \| ([^|]+) \|'
-            matches = re.findall(change_log_pattern, content)
+            matches = CHANGE_LOG_ROW_PATTERN.findall(content)
             
             for match in matches:
                 timestamp, contributor, user_id, summary = match
@@ -463,8 +461,7 @@ CRITICAL TOOL USAGE:
                     })
             
             # Look for Recent Updates section content
-            recent_updates_pattern = r'## Recent Updates\s*\n(.*?)(?=\n##|\n---|$)'
-            recent_match = re.search(recent_updates_pattern, content, re.DOTALL)
+            recent_match = RECENT_UPDATES_PATTERN.search(content)
             
             if recent_match and recent_match.group(1).strip() != '*Latest changes and additions to this document*':
                 updates_content = recent_match.group(1).strip()
@@ -555,13 +552,16 @@ CRITICAL TOOL USAGE:
             conversation_items = []
             
             async with aiosqlite.connect(str(unified_db_path)) as conn:
-                # Query conversations for this project
+                # Query conversations for this project. IDs are "{slug}:{user_id}", so a
+                # half-open range on the "slug:" prefix (':' + 1 == ';') is an index range
+                # scan; LIKE 'slug:%' is case-insensitive, can't use the index and treats
+                # '_' in the slug as a wildcard.
                 cursor = await conn.execute("""
                     SELECT role, content, timestamp, user_id, metadata 
                     FROM conversations 
-                    WHERE conversation_id LIKE ? 
+                    WHERE conversation_id >= ? AND conversation_id < ?
                     ORDER BY timestamp ASC
-                """, (f"{project_slug}:%",))
+                """, (f"{project_slug}:", f"{project_slug};"))
                 
                 rows = await cursor.fetchall()
                 
@@ -15,6 +15,7 @@ import asyncio
 import sqlite3
 import aiosqlite
 import json
+import logging
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
@@ -29,6 +30,9 @@ from app.core.conversation_id_manager import ConversationIDManager, Conversation
 from app.core.migration_logging import get_migration_logger, MigrationEventType, MigrationSeverity
 from app.core.feature_flags import is_feature_enabled
 from app.core.memory_unified import get_unified_memory
+from app.core.script_bootstrap import bootstrap_script
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class MigrationPlan:
@@ -500,15 +504,13 @@ async def main():
         return migration_success
         
     except Exception as e:
-        print(f"❌ Migration failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Migration failed with error: %s", e)
         return False
 
 if __name__ == "__main__":
+    bootstrap_script()
     # Import required modules
     import aiosqlite
     from app.core.migration_logging import MigrationEvent
-    
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -14,6 +14,7 @@ This script:
 
 import asyncio
 import json
+import logging
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
@@ -27,6 +28,9 @@ sys.path.insert(0, 'app')
 from app.core.memory_unified import get_unified_memory
 from app.core.migration_logging import get_migration_logger, MigrationEventType, MigrationSeverity, MigrationEvent
 from app.core.feature_flags import is_feature_enabled
+from app.core.script_bootstrap import bootstrap_script
+
+logger = logging.getLogger(__name__)
 
 class LegacyCleanupManager:
     """Manages the safe removal of legacy memory system components."""
@@ -486,11 +490,10 @@ async def main():
         return overall_success
         
     except Exception as e:
-        print(f"❌ Cleanup failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Cleanup failed with error: %s", e)
         return False
 
 if __name__ == "__main__":
+    bootstrap_script()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
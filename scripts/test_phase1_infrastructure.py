@@ -16,24 +16,34 @@ import sys
 import os
 import tempfile
 import json
+import logging
 from pathlib import Path
 from datetime import datetime
 
 # Add the app directory to Python path
 sys.path.insert(0, 'app')
 
+from app.core.script_bootstrap import bootstrap_script, run_buffered
+
+logger = logging.getLogger(__name__)
+
+from app.core.migration_logging import MigrationEvent, MigrationEventType, MigrationSeverity
+
 async def test_feature_flags():
     """Test feature flags system."""
     print("\n🏁 Testing Feature Flags System")
     print("=" * 50)
     
     try:
-        from app.core.feature_flags import get_feature_flags, MigrationPhase, is_feature_enabled
+        from app.core.feature_flags import get_feature_flags, MigrationPhase
         
         # Test initialization
         flags = await get_feature_flags()
         print("✅ Feature flags system initialized successfully")
         
+        # Resolve all flags once instead of awaiting each lookup
+        snapshot = await flags.snapshot()
+        
         # Test phase 1 flags are enabled
         phase1_flags = [
             "conversation_id_manager",
@@ -42,14 +52,14 @@ async def test_feature_flags():
         ]
         
         for flag_name in phase1_flags:
-            enabled = await is_feature_enabled(flag_name)
+            enabled = snapshot[flag_name]
             status = "✅" if enabled else "❌"
             print(f"{status} {flag_name}: {'ENABLED' if enabled else 'DISABLED'}")
         
         # Test phase 2 flags are disabled  
         phase2_flags = ["unified_memory_primary", "active_data_migration"]
         for flag_name in phase2_flags:
-            enabled = await is_feature_enabled(flag_name)
+            enabled = snapshot[flag_name]
             status = "✅" if not enabled else "❌"
             print(f"{status} {flag_name}: {'DISABLED' if not enabled else 'ENABLED'} (should be disabled)")
         
@@ -63,9 +73,7 @@ async def test_feature_flags():
         return True
         
     except Exception as e:
-        print(f"❌ Feature flags test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Feature flags test failed: %s", e)
         return False
 
 async def test_migration_logging():
@@ -74,13 +82,10 @@ async def test_migration_logging():
     print("=" * 50)
     
     try:
-        from app.core.migration_logging import (
-            get_migration_logger, log_migration_event, 
-            MigrationEventType, MigrationSeverity
-        )
+        from app.core.migration_logging import get_migration_logger, log_migration_event
         
         # Test initialization
-        logger = await get_migration_logger()
+        migration_logger = await get_migration_logger()
         print("✅ Migration logger initialized successfully")
         
         # Test event logging
@@ -93,7 +98,7 @@ async def test_migration_logging():
         print("✅ Event logging working")
         
         # Test operation tracking
-        operation_id = await logger.start_operation(
+        operation_id = await migration_logger.start_operation(
             "test_validation", 
             project_slug="test-infrastructure"
         )
@@ -101,7 +106,7 @@ async def test_migration_logging():
         # Simulate some work
         await asyncio.sleep(0.1)
         
-        await logger.complete_operation(
+        await migration_logger.complete_operation(
             operation_id, 
             success=True, 
             message="Infrastructure test completed", 
@@ -110,7 +115,7 @@ async def test_migration_logging():
         print("✅ Operation tracking working")
         
         # Test conversation operation logging
-        await logger.log_conversation_operation(
+        await migration_logger.log_conversation_operation(
             "read",
             "test-infrastructure:test-user",
             user_id="test-user",
@@ -124,9 +129,7 @@ async def test_migration_logging():
         return True
         
     except Exception as e:
-        print(f"❌ Migration logging test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Migration logging test failed: %s", e)
         return False
 
 async def test_conversation_id_manager():
@@ -155,12 +158,10 @@ async def test_conversation_id_manager():
             "weird_format_123"
         ]
         
-        for test_id in test_ids:
-            analysis = ConversationIDManager.analyze_id(test_id)
-            print(f"✅ Analyzed '{test_id}': {analysis.format_type.value} -> {analysis.migration_target}")
-        
-        # Test migration mapping
+        # Test migration mapping - parse each ID once and reuse the analyses below
         migration_map = ConversationIDManager.get_migration_mapping(test_ids)
+        for test_id, analysis in migration_map.items():
+            print(f"✅ Analyzed '{test_id}': {analysis.format_type.value} -> {analysis.migration_target}")
         print(f"✅ Migration mapping created for {len(migration_map)} IDs")
         
         # Test consolidation plan
@@ -176,9 +177,7 @@ async def test_conversation_id_manager():
         return True
         
     except Exception as e:
-        print(f"❌ Conversation ID manager test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Conversation ID manager test failed: %s", e)
         return False
 
 async def test_data_validator():
@@ -200,29 +199,30 @@ async def test_data_validator():
         if results:
             print(f"✅ Validation completed: {len(results)} checks performed")
             
-            # Show validation summary
-            passed_count = sum(1 for result in results.values() if result.passed)
+            # Show each check and count passes in the same pass over the results
+            passed_count = 0
             total_count = len(results)
-            
-            print(f"📊 Validation Results: {passed_count}/{total_count} checks passed")
+            threshold = total_count // 2 + 1  # More than half should pass
             
             for check_name, result in results.items():
                 status = "✅" if result.passed else "⚠️"
                 print(f"{status} {check_name}: {result.message}")
                 
-                # Show critical issues
-                if not result.passed and check_name in ["database_structure", "migration_readiness"]:
+                if result.passed:
+                    passed_count += 1
+                elif check_name in ["database_structure", "migration_readiness"]:
+                    # Show critical issues
                     print(f"   ❗ Critical issue: {result.details}")
             
-            return passed_count > total_count // 2  # At least half should pass
+            print(f"📊 Validation Results: {passed_count}/{total_count} checks passed")
+            
+            return passed_count >= threshold
         else:
             print("❌ Validation returned no results")
             return False
         
     except Exception as e:
-        print(f"❌ Data validator test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Data validator test failed: %s", e)
         return False
 
 async def test_integration():
@@ -231,23 +231,25 @@ async def test_integration():
     print("=" * 50)
     
     try:
-        from app.core.feature_flags import is_feature_enabled
-        from app.core.migration_logging import get_migration_logger, MigrationEventType, MigrationSeverity
+        from app.core.feature_flags import get_feature_flags
+        from app.core.migration_logging import get_migration_logger, fast_iso_utc
         from app.core.conversation_id_manager import ConversationIDManager
         from app.core.data_validator import get_data_validator
         
+        flags = await (await get_feature_flags()).snapshot()
+        
         # Test feature flag controlled logging
-        if await is_feature_enabled("memory_migration_logging"):
-            logger = await get_migration_logger()
-            await logger.log_event(MigrationEvent(
+        if flags["memory_migration_logging"]:
+            migration_logger = await get_migration_logger()
+            await migration_logger.log_event(MigrationEvent(
                 event_type=MigrationEventType.PHASE_CHANGE,
                 severity=MigrationSeverity.INFO,
                 message="Phase 1 infrastructure integration test",
-                timestamp=datetime.now().isoformat(),
+                timestamp=fast_iso_utc(),
                 migration_phase="phase_1_safety",
                 feature_flags={
-                    "conversation_id_manager": await is_feature_enabled("conversation_id_manager"),
-                    "data_integrity_validation": await is_feature_enabled("data_integrity_validation")
+                    "conversation_id_manager": flags["conversation_id_manager"],
+                    "data_integrity_validation": flags["data_integrity_validation"]
                 }
             ))
             print("✅ Feature-flag controlled logging integration working")
@@ -256,8 +258,8 @@ async def test_integration():
         test_conversation_id = "integration-test:test-user"
         analysis = ConversationIDManager.analyze_id(test_conversation_id)
         
-        logger = await get_migration_logger()
-        await logger.log_conversation_operation(
+        migration_logger = await get_migration_logger()
+        await migration_logger.log_conversation_operation(
             "resolve_id",
             test_conversation_id,
             user_id="test-user", 
@@ -268,7 +270,7 @@ async def test_integration():
         print("✅ ID manager + logging integration working")
         
         # Test data validator with feature flag checks
-        if await is_feature_enabled("data_integrity_validation"):
+        if flags["data_integrity_validation"]:
             validator = await get_data_validator()
             # Just test that we can initialize and check basic functionality
             # Don't run full validation to save time
@@ -277,9 +279,7 @@ async def test_integration():
         return True
         
     except Exception as e:
-        print(f"❌ Integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Integration test failed: %s", e)
         return False
 
 async def main():
@@ -289,14 +289,33 @@ async def main():
     print(f"Started at: {datetime.now().isoformat()}")
     print()
     
-    test_results = {}
-    
-    # Run all tests
-    test_results['feature_flags'] = await test_feature_flags()
-    test_results['migration_logging'] = await test_migration_logging()
-    test_results['conversation_id_manager'] = await test_conversation_id_manager()
-    test_results['data_validator'] = await test_data_validator()
-    test_results['integration'] = await test_integration()
+    # Run all tests concurrently - they are independent, so their I/O waits overlap
+    test_names = [
+        'feature_flags',
+        'migration_logging',
+        'conversation_id_manager',
+        'data_validator',
+        'integration'
+    ]
+    try:
+        results = await asyncio.gather(
+            run_buffered(test_feature_flags()),
+            run_buffered(test_migration_logging()),
+            run_buffered(test_conversation_id_manager()),
+            run_buffered(test_data_validator()),
+            run_buffered(test_integration()),
+            return_exceptions=True
+        )
+    finally:
+        # Release pooled database connections and flush the migration log so the process can exit
+        from app.core.memory_unified import reset_unified_memory
+        from app.core.migration_logging import shutdown_migration_logger
+        await reset_unified_memory()
+        await shutdown_migration_logger()
+    test_results = {
+        name: False if isinstance(result, BaseException) else result
+        for name, result in zip(test_names, results)
+    }
     
     # Summary
     print("\n" + "=" * 60)
@@ -322,8 +341,7 @@ async def main():
         return False
 
 if __name__ == "__main__":
-    # Import here to avoid issues with missing imports
-    from app.core.migration_logging import MigrationEvent
-    
+    # Buffer each concurrent test's output, tracebacks included
+    bootstrap_script(task_local_output=True)
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -17,48 +17,61 @@ import sys
 import os
 import tempfile
 import json
+import logging
 from pathlib import Path
 from datetime import datetime
 
 # Add the app directory to Python path
 sys.path.insert(0, 'app')
 
+from app.core.script_bootstrap import bootstrap_script, run_buffered
+
+logger = logging.getLogger(__name__)
+
 async def test_unified_memory_initialization():
     """Test unified memory system initialization."""
     print("\n🔧 Testing Unified Memory System Initialization")
     print("=" * 60)
     
     try:
-        from app.core.memory_unified import get_unified_memory
+        from app.core.memory_unified import get_unified_memory, UnifiedMemoryManager
         
         # Test initialization
-        unified_memory = await get_unified_memory()
+        await get_unified_memory()
         print("✅ Unified memory system initialized successfully")
         
-        # Test basic functionality
-        test_key = "test_memory_entry"
-        test_content = "This is a test memory entry"
-        
-        success = await unified_memory.save_memory(test_key, test_content)
-        if success:
-            print("✅ Memory save operation working")
-        else:
-            print("❌ Memory save operation failed")
-            return False
-        
-        loaded_content = await unified_memory.load_memory(test_key)
-        if loaded_content == test_content:
-            print("✅ Memory load operation working")
-        else:
-            print(f"❌ Memory load operation failed: expected '{test_content}', got '{loaded_content}'")
-            return False
-        
-        return True
+        # Test basic functionality against a shared-cache in-memory database - the
+        # round-trip doesn't need persistence, so keep it off the on-disk DB
+        with tempfile.TemporaryDirectory() as memory_dir:
+            unified_memory = UnifiedMemoryManager(
+                db_path="file:phase2-init-test?mode=memory&cache=shared",
+                memory_dir=memory_dir
+            )
+            if not await unified_memory.initialize():
+                print("❌ In-memory unified memory initialization failed")
+                return False
+            
+            test_key = "test_memory_entry"
+            test_content = "This is a test memory entry"
+            
+            success = await unified_memory.save_memory(test_key, test_content)
+            if success:
+                print("✅ Memory save operation working")
+            else:
+                print("❌ Memory save operation failed")
+                return False
+            
+            loaded_content = await unified_memory.load_memory(test_key)
+            if loaded_content == test_content:
+                print("✅ Memory load operation working")
+            else:
+                print(f"❌ Memory load operation failed: expected '{test_content}', got '{loaded_content}'")
+                return False
+            
+            return True
         
     except Exception as e:
-        print(f"❌ Unified memory initialization test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Unified memory initialization test failed: %s", e)
         return False
 
 async def test_conversation_memory_operations():
@@ -84,11 +97,16 @@ async def test_conversation_memory_operations():
             print(f"❌ Conversation ID generation failed: expected {expected_id}, got {conversation_id}")
             return False
         
-        # Test adding messages
-        await unified_memory.add_message(conversation_id, "user", "Hello, this is a test message", user_id)
+        # Test adding messages - one transaction inserts both in order, so the
+        # retrieval check below can rely on user-then-assistant ordering
+        success = await unified_memory.add_messages_bulk(conversation_id, [
+            {"role": "user", "content": "Hello, this is a test message"},
+            {"role": "assistant", "content": "Hello! I understand this is a test. How can I help you?"}
+        ], user_id)
+        if not success:
+            print("❌ Adding messages failed")
+            return False
         print("✅ User message added successfully")
-        
-        await unified_memory.add_message(conversation_id, "assistant", "Hello! I understand this is a test. How can I help you?", user_id)
         print("✅ Assistant message added successfully")
         
         # Test retrieving conversation
@@ -115,9 +133,7 @@ async def test_conversation_memory_operations():
         return True
         
     except Exception as e:
-        print(f"❌ Conversation memory operations test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Conversation memory operations test failed: %s", e)
         return False
 
 async def test_project_document_management():
@@ -190,9 +206,7 @@ Initial content for testing.
         return True
         
     except Exception as e:
-        print(f"❌ Project document management test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Project document management test failed: %s", e)
         return False
 
 async def test_feature_flag_integration():
@@ -252,9 +266,7 @@ async def test_feature_flag_integration():
         return True
         
     except Exception as e:
-        print(f"❌ Feature flag integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Feature flag integration test failed: %s", e)
         return False
 
 async def test_migration_logging_integration():
@@ -266,7 +278,7 @@ async def test_migration_logging_integration():
         from app.core.migration_logging import get_migration_logger, log_conversation_read, log_conversation_write
         
         # Test logging integration
-        logger = await get_migration_logger()
+        migration_logger = await get_migration_logger()
         print("✅ Migration logger retrieved successfully")
         
         # Test conversation operation logging
@@ -280,7 +292,7 @@ async def test_migration_logging_integration():
         
         # Test migration summary (should work even with limited data)
         try:
-            summary = await logger.get_migration_summary(hours=1)
+            summary = await migration_logger.get_migration_summary(hours=1)
             if isinstance(summary, dict) and 'total_events' in summary:
                 print(f"✅ Migration summary generated: {summary['total_events']} events in last hour")
             else:
@@ -291,9 +303,7 @@ async def test_migration_logging_integration():
         return True
         
     except Exception as e:
-        print(f"❌ Migration logging integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Migration logging integration test failed: %s", e)
         return False
 
 async def test_end_to_end_conversation_flow():
@@ -382,9 +392,7 @@ async def test_end_to_end_conversation_flow():
         return True
         
     except Exception as e:
-        print(f"❌ End-to-end conversation flow test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ End-to-end conversation flow test failed: %s", e)
         return False
 
 async def main():
@@ -396,13 +404,27 @@ async def main():
     
     test_results = {}
     
-    # Run all tests
+    # Initialization runs first since the other tests use the unified memory it sets up
     test_results['unified_memory_init'] = await test_unified_memory_initialization()
-    test_results['conversation_operations'] = await test_conversation_memory_operations()
-    test_results['document_management'] = await test_project_document_management()
-    test_results['feature_flag_integration'] = await test_feature_flag_integration()
-    test_results['migration_logging'] = await test_migration_logging_integration()
-    test_results['end_to_end_flow'] = await test_end_to_end_conversation_flow()
+    
+    # The remaining tests use separate projects/keys, so run them concurrently
+    test_names = [
+        'conversation_operations',
+        'document_management',
+        'feature_flag_integration',
+        'migration_logging',
+        'end_to_end_flow'
+    ]
+    results = await asyncio.gather(
+        run_buffered(test_conversation_memory_operations()),
+        run_buffered(test_project_document_management()),
+        run_buffered(test_feature_flag_integration()),
+        run_buffered(test_migration_logging_integration()),
+        run_buffered(test_end_to_end_conversation_flow()),
+        return_exceptions=True
+    )
+    for name, result in zip(test_names, results):
+        test_results[name] = False if isinstance(result, BaseException) else result
     
     # Summary
     print("\n" + "=" * 70)
@@ -428,5 +450,7 @@ async def main():
         return False
 
 if __name__ == "__main__":
+    # Buffer each concurrent test's output, tracebacks included
+    bootstrap_script(task_local_output=True)
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
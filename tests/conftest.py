@@ -1,11 +1,7 @@
 import pytest
-import asyncio
 import os
-import sys
-from pathlib import Path
 
-# Add the app directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.script_bootstrap import new_event_loop
 
 # Set test environment
 os.environ["ENVIRONMENT"] = "test"
@@ -13,7 +9,23 @@ os.environ["LOG_LEVEL"] = "DEBUG"
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create one event loop shared by the whole test session."""
+    loop = new_event_loop()
     yield loop
-    loop.close()
\ No newline at end of file
+    try:
+        from app.langgraph_runner import close_shared_http_client
+    except ImportError:
+        pass
+    else:
+        # Close pooled OpenAI connections while the loop that owns them can still run
+        loop.run_until_complete(close_shared_http_client())
+    loop.close()
+
+def pytest_configure(config):
+    """Import the app once at session start (once per xdist worker) so test modules hit a warm cache."""
+    try:
+        import app.langgraph_runner  # noqa: F401
+        import app.main  # noqa: F401
+    except ImportError:
+        # Missing optional deps are reported by the test modules' own importorskip
+        pass
@@ -1,99 +1,187 @@
 import pytest
-import tempfile
-import shutil
-import sys
-import json
 import asyncio
-from pathlib import Path
+import re
+from collections import Counter
+from typing import Any, Dict
 from unittest.mock import patch, AsyncMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Skip the whole module at collection time when FastAPI isn't installed
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
 
 from app.langgraph_runner import (
     MarkdownMemory, 
     ProjectRegistry, 
     make_graph,
     stream_chat_response,
-    INDEX_FILE
+    get_shared_http_client,
+    LLM_REQUEST_TIMEOUT
 )
 from app.main import app
+from app.core.json_compat import loads as json_loads
 
-try:
-    from fastapi.testclient import TestClient
-except ImportError:
-    # Fallback for testing without FastAPI installed
-    TestClient = None
+# JSON payload of an SSE data frame, matched in one step instead of startswith + slice
+SSE_DATA_PATTERN = re.compile(r"data: (\{.*\})\s*")
+
+# Pre-encoded SSE error frame for the streaming error test; its shape is fixed
+_ERR_CHUNK = b'data: {"error": "Simulated streaming error"}\n\n'
 
 # Test fixtures
-@pytest.fixture
-def temp_memory_dir():
-    """Create a temporary directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    
-    # Mock the memory directory
-    with patch('app.langgraph_runner.MEMORY_DIR', Path(temp_dir)):
-        with patch('app.langgraph_runner.INDEX_FILE', Path(temp_dir) / "index.json"):
-            yield Path(temp_dir)
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
+@pytest.fixture(autouse=True, scope="module")
+def _mock_llm():
+    """Patch ChatOpenAI once for the module so no test can reach the real OpenAI API."""
+    with patch('app.langgraph_runner.ChatOpenAI') as mock_llm:
+        mock_llm.return_value = AsyncMock()
+        yield mock_llm
 
 @pytest.fixture
+def temp_memory_dir(tmp_path, monkeypatch):
+    """Point the memory directory at a fresh temporary directory for a test that touches it.
+
+    tmp_path is unique per test and pytest-xdist worker and cleaned up by pytest,
+    so the suite can run in parallel with ``pytest -n auto``.
+    """
+    monkeypatch.setattr('app.langgraph_runner.MEMORY_DIR', tmp_path)
+    monkeypatch.setattr('app.langgraph_runner.INDEX_FILE', tmp_path / "index.json")
+    return tmp_path
+
+@pytest.fixture(scope="session")
 def client():
-    """FastAPI test client."""
-    if TestClient is None:
-        pytest.skip("FastAPI not available for testing")
+    """FastAPI test client, shared by all endpoint tests."""
     return TestClient(app)
 
+class _FakeRegistry:
+    """Dict-backed ProjectRegistry stand-in with plain async methods (no Mock machinery)."""
+    projects: Dict[str, Any] = {}
+    calls: Counter = Counter()
+    
+    @classmethod
+    def reset(cls, projects: Dict[str, Any] = None):
+        cls.projects = dict(projects or {})
+        cls.calls = Counter()
+    
+    @classmethod
+    async def list_projects(cls) -> Dict[str, Any]:
+        cls.calls["list_projects"] += 1
+        return dict(cls.projects)
+    
+    @classmethod
+    async def add_project(cls, slug: str, metadata: Dict[str, Any] = None) -> None:
+        cls.calls["add_project"] += 1
+        cls.projects[slug] = {"status": "active", **(metadata or {})}
+    
+    @classmethod
+    async def get_projects_by_status(cls, status: str = "active") -> Dict[str, Any]:
+        cls.calls["get_projects_by_status"] += 1
+        return {slug: data for slug, data in cls.projects.items() if data.get("status", "active") == status}
+
+class _FakeMemory:
+    """Unified memory stand-in serving fixed project content and counting calls."""
+    content = ""
+    calls: Counter = Counter()
+    
+    @classmethod
+    def reset(cls, content: str = ""):
+        cls.content = content
+        cls.calls = Counter()
+    
+    @classmethod
+    async def save_project(cls, project_name: str, content: str, user_id: str = "anonymous") -> bool:
+        cls.calls["save_project"] += 1
+        cls.content = content
+        return True
+    
+    @classmethod
+    async def get_project(cls, project_name: str) -> str:
+        cls.calls["get_project"] += 1
+        return cls.content
+
+async def _get_fake_memory():
+    return _FakeMemory
+
+@pytest.fixture
+def fake_registry(monkeypatch):
+    """Install the fake registry and memory for endpoint tests; state is reset per test.
+    
+    The routes import both names at request time, so patching the defining modules reaches them.
+    """
+    _FakeRegistry.reset()
+    _FakeMemory.reset()
+    monkeypatch.setattr('app.langgraph_runner.ProjectRegistry', _FakeRegistry)
+    monkeypatch.setattr('app.core.memory_unified.get_unified_memory', _get_fake_memory)
+    return _FakeRegistry
+
 # Test MarkdownMemory
-@pytest.mark.asyncio
-async def test_markdown_memory_creation(temp_memory_dir):
-    """Test markdown file creation and initial content."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
-    memory = MarkdownMemory("test-project")
-    
-    await memory.ensure_file_exists()
-    
+@pytest.fixture(scope="module")
+async def initialized_memory(tmp_path_factory):
+    """MarkdownMemory whose file is created once and shared by the parametrized checks.
+    
+    Each check touches only its own section, so the checks don't depend on their order.
+    """
+    memory_dir = tmp_path_factory.mktemp("markdown-memory")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('app.langgraph_runner.MEMORY_DIR', memory_dir)
+        mp.setattr('app.langgraph_runner.INDEX_FILE', memory_dir / "index.json")
+        memory = MarkdownMemory("test-project")
+        await memory.ensure_file_exists()
+        yield memory
+
+async def _section_content(memory, title: str) -> str:
+    sections = {section.title: section.content for section in await memory.parse_sections()}
+    return sections[title]
+
+async def _check_creation(memory):
+    """Markdown file creation and initial structure."""
     assert memory.file_path.exists()
     content = await memory.read_content()
-    assert "# Test Project" in content
-    assert "## Conversation History" in content
-    assert "Created:" in content
-
-@pytest.mark.asyncio
-async def test_markdown_memory_append_qa(temp_memory_dir):
-    """Test appending Q&A pairs to markdown."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
-    memory = MarkdownMemory("test-project")
-    
-    await memory.ensure_file_exists()
-    await memory.append_qa("What is this project?", "This is a test project.")
+    assert content.startswith("# Test Project")
+    assert "_Last updated:" in content
+    assert "## Executive Summary" in content
+    assert "## Change Log" in content
+
+async def _check_update_section(memory):
+    """Adding to an existing section keeps it in place."""
+    await memory.update_section("Context", "Built to exercise the test suite.")
     
-    content = await memory.read_content()
-    assert "### Q: What is this project?" in content
-    assert "**A:** This is a test project." in content
+    context = await _section_content(memory, "Context")
+    assert "Built to exercise the test suite." in context
+
+async def _check_new_section(memory):
+    """Adding to a missing section creates it before the change log."""
+    await memory.update_section("Test Decisions", "Keep project documents in markdown.")
+    
+    decisions = await _section_content(memory, "Test Decisions")
+    assert "Keep project documents in markdown." in decisions
+    titles = [section.title for section in await memory.parse_sections()]
+    assert titles.index("Test Decisions") < titles.index("Change Log")
 
-@pytest.mark.asyncio
-async def test_markdown_memory_conversation_history(temp_memory_dir):
-    """Test extracting conversation history."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
+@pytest.mark.parametrize(
+    "check",
+    [_check_creation, _check_update_section, _check_new_section],
+    ids=["creation", "update_section", "new_section"]
+)
+async def test_markdown_memory(initialized_memory, check):
+    """Test MarkdownMemory operations against one file created for the module."""
+    await check(initialized_memory)
+
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_read_content_uses_unbuffered():
+    """Test that whole-file reads use one unbuffered read with newline translation."""
     memory = MarkdownMemory("test-project")
+    memory.file_path.parent.mkdir(parents=True, exist_ok=True)
+    memory.file_path.write_bytes(b"# Test Project\r\n\r\nLine\rEnd\n")
     
-    await memory.ensure_file_exists()
-    await memory.append_qa("Question 1", "Answer 1")
-    await memory.append_qa("Question 2", "Answer 2")
+    real_open = open
+    with patch('builtins.open', side_effect=real_open) as mock_open:
+        content = await memory.read_content()
     
-    history = await memory.get_conversation_history()
-    assert "Question 1" in history
-    assert "Question 2" in history
-    assert history.startswith("## Conversation History")
+    assert content == "# Test Project\n\nLine\nEnd\n"
+    assert any(call.kwargs.get('buffering') == 0 for call in mock_open.call_args_list)
 
 # Test ProjectRegistry
-@pytest.mark.asyncio
-async def test_project_registry_operations(temp_memory_dir):
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_project_registry_operations():
     """Test project registry CRUD operations."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
     # Test empty registry
     index = await ProjectRegistry.load_index()
     assert index == {}
@@ -118,128 +206,109 @@ def test_health_endpoint(client):
     assert response.status_code == 200
     assert response.json() == {"status": "healthy", "service": "project-planner-bot"}
 
-@pytest.mark.asyncio
-async def test_create_project_endpoint(client, temp_memory_dir):
+async def test_create_project_endpoint(client, fake_registry):
     """Test project creation endpoint."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
+    response = client.post("/api/projects", json={
+        "name": "Test Project",
+        "description": "A test project"
+    })
     
-    # Patch the correct import paths
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value={})
-        mock_registry.add_project = AsyncMock()
-        
-        with patch('app.langgraph_runner.MarkdownMemory') as mock_memory:
-            mock_memory_instance = AsyncMock()
-            mock_memory.return_value = mock_memory_instance
-            
-            response = client.post("/api/projects", json={
-                "name": "Test Project",
-                "description": "A test project"
-            })
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["slug"] == "test-project"
-            assert "created successfully" in data["message"]
-            
-            # Verify the mocks were called
-            mock_registry.list_projects.assert_called_once()
-            mock_registry.add_project.assert_called_once()
-            mock_memory_instance.ensure_file_exists.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_list_projects_endpoint(client):
+    assert response.status_code == 200
+    data = response.json()
+    assert data["slug"] == "test-project"
+    assert "created successfully" in data["message"]
+    
+    # Verify the fakes were called
+    assert fake_registry.calls["list_projects"] == 1
+    assert fake_registry.calls["add_project"] == 1
+    assert fake_registry.projects["test-project"]["description"] == "A test project"
+    assert _FakeMemory.calls["save_project"] == 1
+    assert "# Test Project" in _FakeMemory.content
+
+async def test_list_projects_endpoint(client, fake_registry):
     """Test project listing endpoint."""
-    mock_projects = {
+    fake_registry.reset({
         "test-project": {
             "name": "Test Project",
             "created": "2024-01-01T00:00:00",
             "status": "active"
         }
-    }
+    })
     
-    # Patch the correct import path
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value=mock_projects)
-        
-        response = client.get("/api/projects")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["slug"] == "test-project"
-        assert data[0]["name"] == "Test Project"
-        assert data[0]["status"] == "active"
-        
-        # Verify the mock was called
-        mock_registry.list_projects.assert_called_once()
+    response = client.get("/api/projects")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["slug"] == "test-project"
+    assert data[0]["name"] == "Test Project"
+    assert data[0]["status"] == "active"
+    
+    # Verify the fake was called
+    assert fake_registry.calls["get_projects_by_status"] == 1
 
 # Test LangGraph integration
-@pytest.mark.asyncio
-async def test_make_graph_creation(temp_memory_dir):
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_make_graph_creation(_mock_llm):
     """Test LangGraph workflow creation."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
-    with patch('app.langgraph_runner.ChatOpenAI') as mock_llm:
-        mock_llm.return_value = AsyncMock()
-        
-        graph = make_graph("test-project", "gpt-4o-mini")
-        
-        assert graph is not None
-        mock_llm.assert_called_once_with(
-            model="gpt-4o-mini",
-            temperature=0.1,
-            streaming=True
-        )
-
-@pytest.mark.asyncio 
-async def test_stream_chat_response(temp_memory_dir):
+    _mock_llm.reset_mock()
+    
+    graph = make_graph("test-project", "gpt-4o-mini")
+    
+    assert graph is not None
+    _mock_llm.assert_called_once()
+    kwargs = _mock_llm.call_args.kwargs
+    assert kwargs["model"] == "gpt-4o-mini"
+    assert kwargs["temperature"] == 0.1
+    assert kwargs["streaming"] is True
+    assert kwargs["timeout"] is LLM_REQUEST_TIMEOUT
+    assert kwargs["http_async_client"] is get_shared_http_client()
+
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_stream_chat_response():
     """Test streaming chat response."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
     
     with patch('app.langgraph_runner.make_graph') as mock_make_graph:
-        # Mock the graph and its streaming response
-        mock_graph = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.content = "Test response from AI"
-        
-        async def mock_astream(*_args, **_kwargs):
-            yield [mock_response]
+        # Stub the graph; stream_chat_response awaits ainvoke and streams the content
+        # of the last message in the returned state
+        class StubResponse:
+            content = "Test response from AI"
         
-        mock_graph.astream = mock_astream
-        mock_make_graph.return_value = mock_graph
+        async def mock_ainvoke(*_args, **_kwargs):
+            return {"messages": [StubResponse()]}
         
-        # Test streaming
-        chunks = []
-        async for chunk in stream_chat_response("test-project", "Hello", "gpt-4o-mini"):
-            chunks.append(chunk)
+        class StubGraph:
+            ainvoke = staticmethod(mock_ainvoke)
         
-        assert len(chunks) > 0
+        mock_make_graph.return_value = StubGraph()
         
-        # Parse the SSE formatted chunks to extract content
+        # Test streaming, parsing each SSE chunk as it arrives and stopping at the done frame
+        chunk_count = 0
         collected_tokens = []
-        for chunk in chunks:
-            if chunk.startswith("data: "):
-                try:
-                    # Extract JSON from SSE format
-                    json_str = chunk[6:]  # Remove "data: " prefix
-                    if json_str.strip():  # Skip empty lines
-                        data = json.loads(json_str.strip())
-                        if 'token' in data:
-                            collected_tokens.append(data['token'])
-                        elif 'done' in data and data['done']:
-                            break
-                except json.JSONDecodeError:
-                    continue  # Skip malformed JSON
+        async for chunk in stream_chat_response("test-project", "Hello", "gpt-4o-mini"):
+            chunk_count += 1
+            match = SSE_DATA_PATTERN.match(chunk)
+            if not match:
+                continue
+            try:
+                data = json_loads(match.group(1))
+            except ValueError:
+                continue  # Skip malformed JSON and empty frames
+            if 'token' in data:
+                collected_tokens.append(data['token'])
+            elif data.get('done'):
+                break
+        
+        assert chunk_count > 0
         
         # Verify we collected tokens from the mocked response
         full_response = ''.join(collected_tokens)
         assert "Test response from AI" in full_response, f"Expected 'Test response from AI' in '{full_response}'"
 
 # Integration test
-@pytest.mark.asyncio
-async def test_full_project_workflow(temp_memory_dir):
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_full_project_workflow():
     """Test complete project creation and chat workflow."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
     # Create project
     await ProjectRegistry.add_project("integration-test", {"name": "Integration Test"})
     
@@ -262,115 +331,82 @@ async def test_full_project_workflow(temp_memory_dir):
     assert projects["integration-test"]["name"] == "Integration Test"
 
 # Test file operations endpoint
-@pytest.mark.asyncio
-async def test_get_project_file_endpoint(client, temp_memory_dir):
+async def test_get_project_file_endpoint(client, fake_registry):
     """Test getting project markdown file content."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
-    
-    mock_projects = {"test-project": {"name": "Test Project"}}
     mock_content = "# Test Project\n\nThis is test content."
+    fake_registry.reset({"test-project": {"name": "Test Project"}})
+    _FakeMemory.reset(mock_content)
     
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value=mock_projects)
-        
-        with patch('app.langgraph_runner.MarkdownMemory') as mock_memory:
-            mock_memory_instance = AsyncMock()
-            mock_memory_instance.read_content = AsyncMock(return_value=mock_content)
-            mock_memory.return_value = mock_memory_instance
-            
-            response = client.get("/api/projects/test-project/file")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["content"] == mock_content
-            
-            # Verify mocks were called
-            mock_registry.list_projects.assert_called_once()
-            mock_memory_instance.read_content.assert_called_once()
+    response = client.get("/api/projects/test-project/file")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["content"] == mock_content
+    
+    # Verify the fakes were called
+    assert fake_registry.calls["list_projects"] == 1
+    assert _FakeMemory.calls["get_project"] == 1
 
 # Test error handling
-@pytest.mark.asyncio
-async def test_create_project_endpoint_duplicate_handling(client, temp_memory_dir):
+async def test_create_project_endpoint_duplicate_handling(client, fake_registry):
     """Test project creation with duplicate name handling."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
     
-    # Mock existing project with same slug
-    existing_projects = {"test-project": {"name": "Existing Project"}}
+    # Existing project with same slug
+    fake_registry.reset({"test-project": {"name": "Existing Project"}})
     
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value=existing_projects)
-        mock_registry.add_project = AsyncMock()
-        
-        with patch('app.langgraph_runner.MarkdownMemory') as mock_memory:
-            mock_memory_instance = AsyncMock()
-            mock_memory.return_value = mock_memory_instance
-            
-            response = client.post("/api/projects", json={
-                "name": "Test Project",  # Will create slug "test-project"
-                "description": "A duplicate test project"
-            })
-            
-            assert response.status_code == 200
-            data = response.json()
-            # Should get a unique slug due to conflict resolution
-            assert data["slug"] == "test-project-1"
-            assert "created successfully" in data["message"]
-
-@pytest.mark.asyncio
-async def test_chat_endpoint_project_not_found(client):
+    response = client.post("/api/projects", json={
+        "name": "Test Project",  # Will create slug "test-project"
+        "description": "A duplicate test project"
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    # Should get a unique slug due to conflict resolution
+    assert data["slug"] == "test-project-1"
+    assert "created successfully" in data["message"]
+
+async def test_chat_endpoint_project_not_found(client, fake_registry):
     """Test chat endpoint with non-existent project."""
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value={})
-        
-        response = client.post("/api/projects/nonexistent/chat", json={
-            "message": "Hello",
-            "model": "gpt-4o-mini"
-        })
-        
-        assert response.status_code == 404
-        assert "Project not found" in response.json()["detail"]
+    response = client.post("/api/projects/nonexistent/chat", json={
+        "message": "Hello",
+        "model": "gpt-4o-mini"
+    })
+    
+    assert response.status_code == 404
+    assert "Project not found" in response.json()["detail"]
 
-@pytest.mark.asyncio  
-async def test_get_file_endpoint_project_not_found(client):
+async def test_get_file_endpoint_project_not_found(client, fake_registry):
     """Test file endpoint with non-existent project."""
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value={})
-        
-        response = client.get("/api/projects/nonexistent/file")
-        
-        assert response.status_code == 404
-        assert "Project not found" in response.json()["detail"]
+    response = client.get("/api/projects/nonexistent/file")
+    
+    assert response.status_code == 404
+    assert "Project not found" in response.json()["detail"]
 
-@pytest.mark.asyncio
-async def test_chat_endpoint_streaming_error_handling(client, temp_memory_dir):
+async def test_chat_endpoint_streaming_error_handling(client, fake_registry):
     """Test chat endpoint error handling during streaming."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
-    
-    mock_projects = {"test-project": {"name": "Test Project"}}
+    fake_registry.reset({"test-project": {"name": "Test Project"}})
     
-    with patch('app.langgraph_runner.ProjectRegistry') as mock_registry:
-        mock_registry.list_projects = AsyncMock(return_value=mock_projects)
+    with patch('app.langgraph_runner.stream_chat_response') as mock_stream:
+        # Mock streaming function that raises an error
+        async def error_stream(*args, **kwargs):
+            yield _ERR_CHUNK
+        
+        mock_stream.return_value = error_stream()
+        
+        response = client.post("/api/projects/test-project/chat", json={
+            "message": "Hello",
+            "model": "gpt-4o-mini"
+        })
         
-        with patch('app.langgraph_runner.stream_chat_response') as mock_stream:
-            # Mock streaming function that raises an error
-            async def error_stream(*args, **kwargs):
-                yield f"data: {json.dumps({'error': 'Simulated streaming error'})}\n\n"
-            
-            mock_stream.return_value = error_stream()
-            
-            response = client.post("/api/projects/test-project/chat", json={
-                "message": "Hello",
-                "model": "gpt-4o-mini"
-            })
-            
-            # Should still return 200 for streaming responses
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "text/event-stream"
-
-@pytest.mark.asyncio
-async def test_project_registry_empty_file_handling(temp_memory_dir):
+        # Should still return 200 for streaming responses
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/event-stream"
+
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_project_registry_empty_file_handling():
     """Test ProjectRegistry handling of empty index file."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
+    # Import under the fixture's patch so the test touches the per-test index, not app/memory
+    from app.langgraph_runner import INDEX_FILE
     
     # Test with non-existent file
     index = await ProjectRegistry.load_index()
@@ -390,33 +426,77 @@ async def test_project_registry_empty_file_handling(temp_memory_dir):
     loaded_data = await ProjectRegistry.load_index()
     assert loaded_data == test_data
 
-@pytest.mark.asyncio
-async def test_markdown_memory_concurrent_access(temp_memory_dir):
-    """Test MarkdownMemory with concurrent access (locking behavior)."""
-    _ = temp_memory_dir  # Use the fixture to avoid warning
+@pytest.mark.usefixtures("temp_memory_dir")
+async def test_markdown_memory_concurrent_access():
+    """Test MarkdownMemory with concurrent writers to one section (locking behavior)."""
     
     memory = MarkdownMemory("concurrent-test")
     
     # Test concurrent file creation
-    async def create_and_append(suffix):
+    async def create_and_update(suffix):
         await memory.ensure_file_exists()
-        await memory.append_qa(f"Question {suffix}", f"Answer {suffix}")
+        await memory.update_section("Context", f"Detail {suffix}")
     
     # Run concurrent operations
-    await asyncio.gather(
-        create_and_append("1"),
-        create_and_append("2"),
-        create_and_append("3")
+    async with asyncio.TaskGroup() as tg:
+        for suffix in ("1", "2", "3"):
+            tg.create_task(create_and_update(suffix))
+    
+    # Verify every writer's addition landed in the section exactly once
+    sections = {section.title: section.content for section in await memory.parse_sections()}
+    context_lines = [line for line in sections["Context"].splitlines() if line.startswith("Detail ")]
+    assert sorted(context_lines) == ["Detail 1", "Detail 2", "Detail 3"]
+
+# Test UnifiedMemoryManager
+async def test_unified_memory_conversation_limit_returns_latest_messages(temp_memory_dir):
+    """A conversation limit keeps the most recent messages, oldest first."""
+    from app.core.memory_unified import UnifiedMemoryManager, reset_unified_memory
+    
+    memory = UnifiedMemoryManager(
+        db_path=str(temp_memory_dir / "unified.db"),
+        memory_dir=str(temp_memory_dir)
     )
+    try:
+        assert await memory.initialize()
+        
+        for i in range(5):
+            await memory.add_message("window-test:anonymous", "user", f"Message {i}")
+        
+        window = await memory.get_conversation("window-test:anonymous", limit=2)
+        assert [msg['content'] for msg in window] == ["Message 3", "Message 4"]
+        
+        bulk = await memory.get_conversations_bulk([("window-test:anonymous", 2)])
+        assert bulk["window-test:anonymous"] == window
+        
+        history = await memory.get_conversation("window-test:anonymous")
+        assert [msg['content'] for msg in history] == [f"Message {i}" for i in range(5)]
+    finally:
+        # Close the pooled connections so their worker threads don't keep the process alive
+        await reset_unified_memory()
+
+async def test_unified_memory_concurrent_section_updates_keep_cache_in_sync(temp_memory_dir):
+    """Concurrent section updates all reach the file, and reads serve what is on disk."""
+    from app.core.memory_unified import UnifiedMemoryManager, reset_unified_memory
     
-    # Verify all content was written
-    content = await memory.read_content()
-    assert "Question 1" in content
-    assert "Question 2" in content
-    assert "Question 3" in content
-    assert "Answer 1" in content
-    assert "Answer 2" in content
-    assert "Answer 3" in content
+    memory = UnifiedMemoryManager(
+        db_path=str(temp_memory_dir / "unified.db"),
+        memory_dir=str(temp_memory_dir)
+    )
+    try:
+        assert await memory.initialize()
+        assert await memory.save_project("section-test", "# Section Test\n\n## Overview\nStart\n")
+        
+        results = await asyncio.gather(*(
+            memory.update_project_section("section-test", f"Section {i}", f"Body {i}")
+            for i in range(5)
+        ))
+        assert all(results)
+        
+        on_disk = (temp_memory_dir / "section-test.md").read_text()
+        assert all(f"## Section {i}" in on_disk for i in range(5))
+        assert await memory.get_project("section-test") == on_disk
+    finally:
+        await reset_unified_memory()
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file